@@ -0,0 +1,50 @@
+"""Benchmark: row-by-row keyword scan vs. the compiled, unique-value alliance classifier.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_map_alliance --rows 1000000
+"""
+import argparse
+import time
+import unicodedata
+import numpy as np
+import pandas as pd
+from src.config import ALLIANCE_KEYWORDS, map_alliance_series
+
+def legacy_map_alliance(p):
+    """The original per-row algorithm: normalize, then substring-scan every keyword list."""
+    if pd.isna(p): return 'Others'
+    p = unicodedata.normalize('NFKC', str(p)).strip()
+    for alliance, keywords in ALLIANCE_KEYWORDS:
+        if any(k in p for k in keywords): return alliance
+    return 'Others'
+
+def synthetic_parties(n_rows, source='data/raw_election_data.csv', seed=42):
+    """Samples party strings with the same frequencies as the real candidate table."""
+    freq = pd.read_csv(source)['Party'].value_counts(dropna=False, normalize=True)
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.choice(freq.index.to_numpy(dtype=object), size=n_rows, p=freq.to_numpy()))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    parties = synthetic_parties(args.rows)
+    print(f"{args.rows:,} rows, {parties.nunique(dropna=False)} distinct party strings")
+
+    start = time.perf_counter()
+    legacy = parties.apply(legacy_map_alliance)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = map_alliance_series(parties)
+    fast_s = time.perf_counter() - start
+
+    identical = legacy.tolist() == fast.astype(str).tolist()
+    print(f"legacy .apply : {legacy_s:8.3f} s")
+    print(f"compiled      : {fast_s:8.3f} s  ({legacy_s / fast_s:,.0f}x faster)")
+    print(f"identical     : {identical}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark: point-lookup latency of the query service under concurrent clients.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_query --clients 32 --requests 2000
+"""
+import argparse
+import random
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.query_service import QueryService, serve_in_background
+
+def percentiles(latencies):
+    ms = np.array(latencies) * 1000
+    return f"p50 {np.percentile(ms, 50):7.3f} ms  p99 {np.percentile(ms, 99):7.3f} ms  max {ms.max():7.3f} ms"
+
+def hammer(call, keys, clients, requests):
+    """Runs ``requests`` calls per client from ``clients`` threads and returns every latency."""
+    def client(seed):
+        rng = random.Random(seed)
+        out = []
+        for _ in range(requests):
+            key = rng.choice(keys)
+            start = time.perf_counter()
+            call(key)
+            out.append(time.perf_counter() - start)
+        return out
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        return [t for chunk in pool.map(client, range(clients)) for t in chunk]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    service = QueryService()
+    print(f"index built in {(time.perf_counter() - start) * 1000:.1f} ms ({len(service.index.seats)} seats)")
+    seat_ids = list(service.index.seats)
+    names = [s['Seat_Name'] for s in service.index.seats.values()]
+
+    print(f"in-process seat     : {percentiles(hammer(service.seat, seat_ids, args.clients, args.requests))}")
+    print(f"in-process by name  : {percentiles(hammer(service.seat_by_name, names, args.clients, args.requests))}")
+    print(f"in-process margins  : {percentiles(hammer(lambda d: service.top_margins(10, d), list(service.index.division_totals), args.clients, args.requests))}")
+
+    server, base_url = serve_in_background(service, port=0)
+    fetch = lambda seat_id: urllib.request.urlopen(f"{base_url}/seat/{seat_id}").read()
+    print(f"HTTP seat           : {percentiles(hammer(fetch, seat_ids, args.clients, args.requests // 10))}")
+    server.shutdown()
+
+if __name__ == '__main__':
+    main()
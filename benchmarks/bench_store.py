@@ -0,0 +1,54 @@
+"""Benchmark: CSV vs. memory-mapped columnar store for a multi-election raw history.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_store --elections 10 --rows 100000
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from src.store import load_table, save_table
+
+def synthetic_history(n_elections, n_rows, source='data/raw_election_data.csv'):
+    """Tiles the real raw table into ``n_elections`` elections totalling ``n_rows`` rows."""
+    base = pd.read_csv(source)
+    reps = int(np.ceil(n_rows / len(base)))
+    df = pd.concat([base] * reps, ignore_index=True).iloc[:n_rows].copy()
+    df.insert(0, 'Election', np.repeat(np.arange(2026 - 5 * (n_elections - 1), 2027, 5),
+                                       int(np.ceil(n_rows / n_elections)))[:n_rows])
+    return df
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--elections', type=int, default=10)
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = synthetic_history(args.elections, args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'history.csv')
+        store = os.path.join(tmp, 'history.cols')
+        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        save_table(df, store)
+
+        csv_s, from_csv = best_of(lambda: pd.read_csv(csv_path))
+        store_s, from_store = best_of(lambda: load_table(store))
+        disk = lambda p: sum(os.path.getsize(os.path.join(p, f)) for f in os.listdir(p)) if os.path.isdir(p) else os.path.getsize(p)
+
+        print(f"{len(df):,} rows, {args.elections} elections")
+        print(f"read_csv   : {csv_s * 1000:8.2f} ms  {from_csv.memory_usage(deep=True).sum() / 1e6:7.2f} MB in memory  {disk(csv_path) / 1e6:6.2f} MB on disk")
+        print(f"load_table : {store_s * 1000:8.2f} ms  {from_store.memory_usage(deep=True).sum() / 1e6:7.2f} MB in memory  {disk(store) / 1e6:6.2f} MB on disk")
+
+if __name__ == '__main__':
+    main()
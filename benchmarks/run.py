@@ -0,0 +1,183 @@
+"""Times and memory-profiles every pipeline stage on synthetic data of growing size.
+
+Runs fully offline (the scraper is pointed at the local fixture server).
+Run from the repository root:
+
+    python -m benchmarks.run --sizes 2000,100000 --save benchmarks/baseline.json
+    python -m benchmarks.run --sizes 2000,100000 --compare benchmarks/baseline.json
+
+``--compare`` exits with status 1 when any stage is slower (or uses more peak
+memory) than the baseline by more than ``--threshold``.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from src.config import map_alliance_series
+from src.enrich import enrich_seats
+from src.process_data import clean_and_process
+from src.weighted_analysis import run_weighted_analysis
+from benchmarks.synthetic import generate_raw
+
+DEFAULT_SIZES = [2_000, 100_000]
+# Charts and the scraper are only meaningful at seat-table scale
+CHART_MAX_ROWS = 100_000
+SCRAPER_MAX_ROWS = 20_000
+
+def _measure(fn, repeat, memory):
+    """Best-of-``repeat`` wall time, plus peak traced allocation from one extra run."""
+    times = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    result = {'seconds': min(times)}
+    if memory:
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        result['peak_mb'] = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    return result
+
+def _scraper_stage(raw_csv, workdir, n_seats):
+    """Benchmarks the HTTP engine of run_scraper against the local fixture server, or None if requests/lxml are unavailable."""
+    try:
+        import requests  # noqa: F401
+        import lxml  # noqa: F401
+    except ImportError:
+        return None
+    from src.fixture_server import serve_in_background
+    from src.scraper import run_scraper
+
+    server, base_url = serve_in_background(raw_csv, port=0)
+    run = [0]
+
+    def scrape():
+        run[0] += 1
+        run_scraper(workers=4, rate_limit=None, base_url=base_url, seat_ids=range(1, n_seats + 1),
+                    output_file=os.path.join(workdir, 'scraped.csv'),
+                    cache_dir=os.path.join(workdir, f'cache{run[0]}'), engine='http')
+    try:
+        scrape()  # warm-up also checks the fixture server answers
+    except Exception:
+        server.shutdown()
+        return None
+    return scrape, server
+
+def run_benchmarks(sizes, repeat=3, memory=True):
+    """Returns ``{stage: {size: {'seconds', 'peak_mb'}}}`` for every stage and size."""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            raw = generate_raw(size)
+            raw_csv = os.path.join(workdir, f'raw_{size}.csv')
+            raw.to_csv(raw_csv, index=False, encoding='utf-8-sig')
+            seats = clean_and_process(raw_csv)
+            seats_csv = os.path.join(workdir, f'seats_{size}.csv')
+            seats.to_csv(seats_csv, index=False)
+            enriched = enrich_seats(seats)
+            key = str(size)
+
+            stages = {
+                'map_alliance': lambda: map_alliance_series(raw['Party']),
+                'clean_and_process': lambda: clean_and_process(raw_csv),
+                'clean_and_process_streaming': lambda: clean_and_process(raw_csv, chunksize=max(size // 10, 1000)),
+                'enrich_seats': lambda: enrich_seats(seats),
+                'run_weighted_analysis': lambda: run_weighted_analysis(seats_csv, os.path.join(workdir, 'div.csv')),
+            }
+            try:
+                from src.analyze import run_decision_tree_analysis
+                stages['run_decision_tree_analysis'] = lambda: run_decision_tree_analysis(enriched)
+            except ImportError:
+                pass
+            if size <= CHART_MAX_ROWS:
+                from src.visualize import generate_charts
+                chart_dir = os.path.join(workdir, f'charts_{size}')
+                # Fresh directory per call so the render cache never short-circuits the timing
+                counter = [0]
+                def charts():
+                    counter[0] += 1
+                    generate_charts(enriched, output_dir=f"{chart_dir}_{counter[0]}", workers=1)
+                stages['generate_charts'] = charts
+
+            for name, fn in stages.items():
+                results.setdefault(name, {})[key] = _measure(fn, repeat, memory)
+                print(f"  {name:<30} {key:>10} rows  {results[name][key]['seconds'] * 1000:10.1f} ms"
+                      + (f"  {results[name][key]['peak_mb']:8.1f} MB" if memory else ''))
+
+            if size <= SCRAPER_MAX_ROWS:
+                scraper = _scraper_stage(raw_csv, workdir, n_seats=int(raw['Seat_ID'].max()))
+                if scraper is None:
+                    print(f"  {'run_scraper':<30} {key:>10} rows  skipped (requests/lxml unavailable)")
+                else:
+                    fn, server = scraper
+                    results.setdefault('run_scraper', {})[key] = _measure(fn, 1, False)
+                    print(f"  {'run_scraper':<30} {key:>10} rows  {results['run_scraper'][key]['seconds'] * 1000:10.1f} ms")
+                    server.shutdown()
+    return results
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+def compare(results, baseline, threshold):
+    """Lists stage/size/metric combinations that regressed past ``threshold`` x baseline."""
+    regressions = []
+    for stage, by_size in results.items():
+        for size, metrics in by_size.items():
+            base = baseline.get('results', {}).get(stage, {}).get(size)
+            if not base:
+                continue
+            for metric, value in metrics.items():
+                if metric in base and base[metric] > 0 and value > base[metric] * threshold:
+                    regressions.append((stage, size, metric, base[metric], value))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='comma-separated candidate-row counts')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--save', help='write results as a JSON baseline')
+    parser.add_argument('--compare', help='baseline JSON to check for regressions')
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    results = run_benchmarks(sizes, repeat=args.repeat, memory=not args.no_memory)
+    report = {'environment': environment(), 'results': results}
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Baseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for stage, size, metric, old, new in regressions:
+            print(f"❌ {stage} @ {size} rows: {metric} {old:.4g} -> {new:.4g} ({new / old:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No regressions beyond {args.threshold:.2f}x of {args.compare}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Synthetic raw election tables that follow the schema of data/raw_election_data.csv.
+
+Everything is generated offline from built-in tables: Bengali numerals (with
+thousands separators on some rows), realistic party strings weighted like the
+2026 results, and a right-skewed number of candidates per seat.
+"""
+import numpy as np
+import pandas as pd
+
+BENGALI_DIGITS = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+
+DIVISIONS = ['Dhaka', 'Chattogram', 'Rajshahi', 'Khulna', 'Barishal', 'Mymensingh', 'Sylhet', 'Rangpur']
+DISTRICTS = ['পঞ্চগড়', 'ঠাকুরগাঁও', 'দিনাজপুর', 'রংপুর', 'বগুড়া', 'রাজশাহী', 'খুলনা', 'যশোর',
+             'বরিশাল', 'ময়মনসিংহ', 'সিলেট', 'কুমিল্লা', 'চট্টগ্রাম', 'নোয়াখালী', 'ঢাকা', 'গাজীপুর']
+
+# (party string, relative weight), drawn from the 2026 candidate table
+PARTIES = [
+    ('বাংলাদেশ জাতীয়তাবাদী দল - বি.এন.পি', 288), ('স্বতন্ত্র', 272), ('ইসলামী আন্দোলন বাংলাদেশ', 255),
+    ('বাংলাদেশ জামায়াতে ইসলামী', 227), ('জাতীয় পার্টি', 190), ('গণঅধিকার পরিষদ (জিওপি)', 88),
+    ('বাংলাদেশের কমিউনিস্ট পার্টি', 62), ('ইনসানিয়াত বিপ্লব বাংলাদেশ', 42), ('বাংলাদেশের সমাজতান্ত্রিক দল-বাসদ', 35),
+    ('বাংলাদেশ খেলাফত মজলিস', 33), ('জাতীয় নাগরিক পার্টি-এনসিপি', 32), ('আমার বাংলাদেশ পার্টি (এবি পার্টি)', 31),
+    ('জাতীয় সমাজতান্ত্রিক দল-জেএসডি', 28), ('বাংলাদেশ ইসলামী ফ্রন্ট', 25), ('খেলাফত মজলিস', 21),
+    ('গণফোরাম', 21), ('ইসলামিক ফ্রন্ট বাংলাদেশ', 20), ('বাংলাদেশ কংগ্রেস', 20),
+    ('বাংলাদেশ সুপ্রীম পার্টি (বি.এস.পি)', 17), ('গণসংহতি আন্দোলন', 17), ('বাংলাদেশ লেবার পার্টি', 14),
+    ('বাংলাদেশ মুসলিম লীগ', 13), ('ন্যাশনাল পিপলস পার্টি (এনপিপি)', 11), ('লিবারেল ডেমোক্রেটিক পার্টি - এলডিপি', 9),
+]
+SYMBOLS = ['ধানের শীষ', 'দাঁড়িপাল্লা', 'শাপলা কলি', 'লাঙ্গল', 'হাতপাখা', 'ট্রাক', 'কলস', 'আপেল']
+
+def to_bengali(values, separators=None):
+    """Formats integers as Bengali numerals, optionally with thousands separators."""
+    text = pd.Series(values).astype(str)
+    if separators is not None:
+        text = text.where(~separators, pd.Series(values).map('{:,}'.format))
+    return text.str.translate(BENGALI_DIGITS)
+
+def generate_raw(n_rows, seed=0):
+    """Returns a raw candidate table with about ``n_rows`` rows.
+
+    Seats scale with size (at least 300) and candidate counts per seat are
+    lognormal, so a few seats have many candidates, as in the real data.
+    """
+    rng = np.random.default_rng(seed)
+    n_seats = max(300, n_rows // 7)
+    per_seat = np.clip(np.round(rng.lognormal(np.log(6), 0.45, n_seats)), 2, 40).astype(int)
+    per_seat = np.maximum(2, np.round(per_seat * n_rows / per_seat.sum()).astype(int))
+    seat_ids = np.repeat(np.arange(1, n_seats + 1), per_seat)
+    n = len(seat_ids)
+
+    seat_district = rng.integers(0, len(DISTRICTS), n_seats)
+    seat_names = np.array([f"{DISTRICTS[d]}-{str(i % 9 + 1).translate(BENGALI_DIGITS)}"
+                           for i, d in enumerate(seat_district)], dtype=object)
+    seat_division = np.array(DIVISIONS, dtype=object)[seat_district % len(DIVISIONS)]
+    electorate = rng.integers(150_000, 700_000, n_seats)
+    centers = rng.integers(60, 260, n_seats)
+    male = (electorate * rng.uniform(0.48, 0.52, n_seats)).astype(int)
+
+    names, weights = zip(*PARTIES)
+    weights = np.array(weights, dtype=float) / sum(weights)
+    votes = np.round(rng.pareto(1.2, n) * 3_000).astype(np.int64).clip(0, 400_000)
+    idx = seat_ids - 1
+
+    df = pd.DataFrame({
+        'Seat_ID': seat_ids,
+        'Seat_Name': seat_names[idx],
+        'Total_Voters': to_bengali(electorate[idx]),
+        'Total_Centers': to_bengali(centers[idx]),
+        'Male_Voters': to_bengali(male[idx]),
+        'Female_Voters': to_bengali((electorate - male)[idx]),
+        'Candidate': [f"প্রার্থী {i}" for i in range(n)],
+        'Party': rng.choice(np.array(names, dtype=object), size=n, p=weights),
+        'Symbol': rng.choice(np.array(SYMBOLS, dtype=object), size=n),
+        'Votes': to_bengali(votes, separators=rng.random(n) < 0.1),
+        'Status': 'পরাজিত',
+        'Division': seat_division[idx],
+    })
+    df.loc[pd.Series(votes).groupby(seat_ids).idxmax().to_numpy(), 'Status'] = 'বিজয়ী'
+    return df
@@ -1,6 +1,26 @@
-from .analyze import run_decision_tree_analysis
-from .visualize import generate_charts, generate_weighted_impact_chart
-from .process_data import clean_and_process
-from .config import get_economic_df
-from .scraper import run_scraper
-from .weighted_analysis import run_weighted_analysis
\ No newline at end of file
+import importlib
+
+# Public entry points, imported on first use (PEP 562) so that `import src`
+# stays cheap and stages that never draw or fit do not load matplotlib/sklearn.
+_EXPORTS = {
+    'run_decision_tree_analysis': 'analyze',
+    'generate_charts': 'visualize',
+    'generate_weighted_impact_chart': 'visualize',
+    'clean_and_process': 'process_data',
+    'get_economic_df': 'config',
+    'run_scraper': 'scraper',
+    'run_weighted_analysis': 'weighted_analysis',
+    'enrich_seats': 'enrich',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
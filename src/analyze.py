@@ -1,13 +1,12 @@
-import pandas as pd
 from sklearn.tree import DecisionTreeClassifier, export_text
-from .config import get_economic_df
+from .enrich import ensure_enriched
+from .profiling import span
 
 def run_decision_tree_analysis(df):
     """Performs Decision Tree analysis to find economic correlation."""
     print("\n--- Running Decision Tree Analysis ---")
     
-    df_econ = get_economic_df()
-    df_model = pd.merge(df, df_econ, on='Division', how='left')
+    df_model = ensure_enriched(df)
     
     if 'Winner_Alliance' not in df_model.columns:
         print("Winner_Alliance column missing. Skipping Decision Tree.")
@@ -24,7 +23,8 @@ def run_decision_tree_analysis(df):
     y = binary_df['Winner_Alliance']
     
     clf = DecisionTreeClassifier(max_depth=3, random_state=42)
-    clf.fit(X, y)
+    with span("analyze:fit_tree", rows=len(X)):
+        clf.fit(X, y)
     
     print("Decision Rules (How the winner is decided):")
     print(export_text(clf, feature_names=['Income', 'Expenditure']))
@@ -0,0 +1,101 @@
+import argparse
+import os
+import sys
+from .pipeline import build_stages, default_paths, run_pipeline
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Pipeline stages each subcommand runs; heavy libraries are imported inside the stage bodies
+COMMANDS = {
+    'scrape': (['scrape'], "Scrape raw results into the raw CSV"),
+    'process': (['process', 'enrich'], "Build the seat table and the enriched seat frame"),
+    'weighted': (['weighted'], "Run the weighted division analysis"),
+    'model': (['model'], "Fit the decision tree on the enriched seats"),
+    'charts': (['charts', 'weighted_charts'], "Render the seat and weighted-impact charts"),
+    'evaluate': (['evaluate'], "Cross-validate tree and ensemble models (cached; minutes on first run)"),
+    'all': (None, "Run the whole pipeline (default)"),
+}
+
+def _add_global_options(parser, suppress=False):
+    """Options every command takes. Subparsers get them with SUPPRESSed defaults,
+    so they work before or after the subcommand without clobbering each other."""
+    default = (lambda value: argparse.SUPPRESS) if suppress else (lambda value: value)
+    parser.add_argument('--base-dir', default=default(PROJECT_ROOT), help="project root (default: this checkout)")
+    parser.add_argument('--data-dir', default=default(None), help="data directory (default: BASE_DIR/data)")
+    parser.add_argument('--images-dir', default=default(None), help="chart directory (default: BASE_DIR/images)")
+    parser.add_argument('--raw', default=default(None), help="raw election CSV (default: DATA_DIR/raw_election_data.csv)")
+    parser.add_argument('--no-csv', action='store_true', default=default(False),
+                        help="keep only the columnar stores, skip CSV exports")
+    parser.add_argument('--force', action='store_true', default=default(False),
+                        help="rerun the selected stages even if up to date (`scrape --force` refetches every seat)")
+    parser.add_argument('--workers', type=int, default=default(None), help="parallel stage processes")
+    parser.add_argument('--trace', metavar='DIR', default=default(None),
+                        help="record profiling spans and a Chrome trace in DIR")
+
+def _add_scrape_options(parser):
+    # Engine names mirror src.scraper.ENGINES; the scraper is only imported when the stage runs
+    parser.add_argument('--engine', choices=('auto', 'http', 'selenium'), default='auto',
+                        help="page fetcher (default: auto, HTTP with a Chrome fallback)")
+    parser.add_argument('--scrape-workers', type=int, default=1, help="concurrent page fetchers")
+    parser.add_argument('--rate-limit', type=float, default=1.2, help="max page loads per second (0: unlimited)")
+    parser.add_argument('--max-retries', type=int, default=2, help="retries per seat with exponential backoff")
+    parser.add_argument('--max-age-hours', type=float,
+                        help="also refetch seats cached longer ago than this (default: only missing or failed seats)")
+    parser.add_argument('--base-url', help="seat page URL prefix, e.g. a local src.fixture_server")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m src.cli',
+                                     description="Bangladesh Election 2026 analysis pipeline.")
+    _add_global_options(parser)
+    subparsers = parser.add_subparsers(dest='command')
+    for name, (_, help_text) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        _add_global_options(subparser, suppress=True)
+        if name == 'scrape':
+            _add_scrape_options(subparser)
+    return parser
+
+def scrape_options(args):
+    """run_scraper keyword arguments from the `scrape` subcommand's options."""
+    options = {
+        'engine': args.engine,
+        'workers': args.scrape_workers,
+        'rate_limit': args.rate_limit or None,
+        'max_retries': args.max_retries,
+        'max_age_hours': args.max_age_hours,
+        'resume': not args.force,
+    }
+    if args.base_url:
+        options['base_url'] = args.base_url
+    return options
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    command = args.command or 'all'
+    if args.trace:
+        from .profiling import enable_tracing
+        enable_tracing(args.trace)
+
+    paths = default_paths(os.path.abspath(args.base_dir), data_dir=args.data_dir, images_dir=args.images_dir)
+    if args.raw:
+        paths['raw'] = os.path.abspath(args.raw)
+
+    names = COMMANDS[command][0]
+    scrape = scrape_options(args) if command == 'scrape' else None
+    stages = [s for s in build_stages(export_csv=not args.no_csv, evaluate=command == 'evaluate', scrape=scrape)
+              if names is None or s.name in names]
+    # --force never re-scrapes the live site unless `scrape` itself was asked for
+    force = [s.name for s in stages if s.name != 'scrape' or command == 'scrape'] if args.force else ()
+
+    print(f"🇧🇩 Bangladesh Election 2026 Analysis: {command}")
+    done, failed = run_pipeline(paths, stages=stages, force=force, workers=args.workers)
+
+    if failed:
+        print(f"\n⚠️  Finished with failed stages: {', '.join(sorted(failed))}")
+        return 1
+    print("\n🎉 Pipeline Complete! Check 'images/' and 'data/' folders." if command == 'all'
+          else f"\n🎉 {command} complete.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
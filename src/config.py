@@ -1,11 +1,20 @@
-import pandas as pd
+import re
 import unicodedata
+from functools import lru_cache
+import pandas as pd
 
 # Project Configuration
 PROJECT_NAME = "Bangladesh_Election_Analysis_2026"
 
+# Alliance vote columns produced by clean_and_process
+ALLIANCE_COLUMNS = ['BNP-A', '11PA', 'DUF', 'GSA', 'IAB', 'IND', 'NDF', 'Others']
+
+@lru_cache(maxsize=1)
 def get_economic_df():
-    """Returns the standardized HIES 2022 Economic Data by Division."""
+    """Returns the standardized HIES 2022 Economic Data by Division.
+
+    Built once and shared; treat it as read-only.
+    """
     econ_data = {
         'Division': ['Dhaka', 'Chattogram', 'Rajshahi', 'Khulna', 'Barishal', 'Mymensingh', 'Sylhet', 'Rangpur'],
         'Monthly_Income': [42696, 34054, 30398, 28192, 25892, 24183, 22861, 21674],
@@ -13,52 +22,70 @@ def get_economic_df():
     }
     return pd.DataFrame(econ_data)
 
-def map_alliance(p):
-    """Maps raw party names to their respective political alliances."""
-    if pd.isna(p): return 'Others'
-    p = unicodedata.normalize('NFKC', str(p)).strip()
-    
+# Party keyword tables in priority order: the first alliance with a matching keyword wins
+ALLIANCE_KEYWORDS = [
     # 1. BNP Alliance (BNP-A)
-    bnp_a_keywords = [
+    ('BNP-A', [
         'বাংলাদেশ জাতীয়তাবাদী দল', 'বিএনপি', 'BNP', 'গণঅধিকার পরিষদ', 'জিওপি', 
         'National People\'s Party', 'এনপিপি', 'গণসংহতি আন্দোলন', 
         'Nationalist Democratic Movement', 'এনডিএম', 'বিপ্লবী ওয়ার্কার্স পার্টি', 'RWP',
         'বাংলাদেশ জাতীয় পার্টি', 'বিজেপি', 'জমিয়তে উলামায়ে ইসলাম', 'JUIB'
-    ]
-    if any(k in p for k in bnp_a_keywords): return 'BNP-A'
-
+    ]),
     # 2. 11 Party Alliance (11PA)
-    jamaat_11pa_keywords = [
+    ('11PA', [
         'বাংলাদেশ জামায়াতে ইসলামী', 'Jamaat', 'বাংলাদেশ খেলাফত মজলিস', 'জাতীয় নাগরিক পার্টি', 
         'এনসিপি', 'এবি পার্টি', 'আমার বাংলাদেশ পার্টি', 'খেলাফত মজলিস', 
         'বাংলাদেশ লেবার পার্টি', 'বাংলাদেশ খেলাফত আন্দোলন', 'লিবারেল ডেমোক্রেটিক পার্টি', 'এলডিপি', 
         'নেজামে ইসলাম', 'বাংলাদেশ ডেভেলপমেন্ট পার্টি', 'জাতীয় গণতান্ত্রিক পার্টি', 'জাগপা'
-    ]
-    if any(k in p for k in jamaat_11pa_keywords): return '11PA'
-
+    ]),
     # 3. National Democratic Front (NDF)
-    ndf_keywords = [
+    ('NDF', [
         'জাতীয় পার্টি', 'Jatiya Party', 'সাংস্কৃতিক মুক্তিজোট', 'Muktijote', 'মুসলিম লীগ', 'Muslim League'
-    ]
-    if any(k in p for k in ndf_keywords): return 'NDF'
-
+    ]),
     # 4. Democratic United Front (DUF)
-    duf_keywords = [
+    ('DUF', [
         'কমিউনিস্ট পার্টি', 'CPB', 'সমাজতান্ত্রিক দল', 'বাসদ', 'BASAD', 'মার্কসবাদী', 
         'জাতীয় সমাজতান্ত্রিক দল', 'গণ ফ্রন্ট', 'গণফ্রন্ট'
-    ]
-    if any(k in p for k in duf_keywords): return 'DUF'
-
+    ]),
     # 5. Greater Sunni Alliance (GSA)
-    gsa_keywords = [
+    ('GSA', [
         'বাংলাদেশ ইসলামী ফ্রন্ট', 'সুপ্রীম পার্টি', 'BSP', 'ইসলামিক ফ্রন্ট বাংলাদেশ'
+    ]),
+    # 6. Islami Andolan Bangladesh (IAB)
+    ('IAB', ['ইসলামী আন্দোলন']),
+    # 7. Independent (IND)
+    ('IND', ['স্বতন্ত্র']),
+]
+
+def compile_alliance_patterns(keyword_table=ALLIANCE_KEYWORDS):
+    """Compiles each alliance's keywords into one alternation regex, keeping priority order."""
+    return [
+        (alliance, re.compile('|'.join(re.escape(k) for k in keywords)))
+        for alliance, keywords in keyword_table
     ]
-    if any(k in p for k in gsa_keywords): return 'GSA'
 
-    # 6. Islami Andolan Bangladesh (IAB)
-    if 'ইসলামী আন্দোলন' in p: return 'IAB'
+_ALLIANCE_PATTERNS = compile_alliance_patterns()
 
-    # 7. Independent (IND)
-    if 'স্বতন্ত্র' in p: return 'IND'
+@lru_cache(maxsize=8192)
+def _classify_party(name):
+    for alliance, pattern in _ALLIANCE_PATTERNS:
+        if pattern.search(name):
+            return alliance
+    return 'Others'
+
+def map_alliance(p):
+    """Maps raw party names to their respective political alliances."""
+    if pd.isna(p): return 'Others'
+    return _classify_party(unicodedata.normalize('NFKC', str(p)).strip())
 
-    return 'Others'
\ No newline at end of file
+def map_alliance_series(parties):
+    """Maps a whole column of party names, classifying each distinct name only once."""
+    codes, uniques = pd.factorize(parties, use_na_sentinel=True)
+    labels = [map_alliance(p) for p in uniques] + ['Others']  # code -1 (missing) -> 'Others'
+    categories = pd.Index(labels).unique().sort_values()
+    remap = categories.get_indexer(labels)
+    return pd.Series(
+        pd.Categorical.from_codes(remap[codes], categories=categories),
+        index=getattr(parties, 'index', None),
+        name='Alliance',
+    )
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+from .config import ALLIANCE_COLUMNS, get_economic_df
+from .profiling import span
+
+ECONOMIC_COLUMNS = ['Monthly_Income', 'Expenditure']
+# Everything enrich_seats adds on top of the clean_and_process columns
+DERIVED_COLUMNS = (['Total_Votes'] + [f'{a}_Share' for a in ALLIANCE_COLUMNS]
+                   + ['Winner_Alliance', 'Runner_Up_Alliance', 'Winner_Votes', 'Runner_Up_Votes',
+                      'Margin', 'Margin_Pct', 'Turnout'] + ECONOMIC_COLUMNS)
+REQUIRED_COLUMNS = ['Total_Votes', 'Winner_Alliance', 'Margin'] + ECONOMIC_COLUMNS
+
+def enrich_seats(df_seats):
+    """Adds every derived seat-level column in one vectorized pass.
+
+    Per seat: total votes, each alliance's share (%), winner and runner-up
+    with their votes, margin (votes and % of the seat total), turnout against
+    ``Total_Voters`` and the division's economic indicators. Seats without any
+    votes get no winner. The input is not modified.
+    """
+    with span("enrich:seats", rows=len(df_seats)):
+        base = df_seats.drop(columns=[c for c in DERIVED_COLUMNS if c in df_seats.columns]).reset_index(drop=True)
+        alliances = [c for c in ALLIANCE_COLUMNS if c in base.columns]
+        votes = base[alliances].to_numpy(dtype=np.int64)
+        totals = votes.sum(axis=1)
+
+        rows = np.arange(len(votes))
+        order = np.argsort(-votes, axis=1, kind='stable')
+        top = votes[rows, order[:, 0]] if alliances else np.zeros(len(votes), dtype=np.int64)
+        second = votes[rows, order[:, 1]] if len(alliances) > 1 else np.zeros(len(votes), dtype=np.int64)
+        labels = np.asarray(alliances + [None], dtype=object)  # index -1 -> None
+        winner = np.where(top > 0, order[:, 0], -1) if alliances else np.full(len(votes), -1)
+        runner_up = np.where(second > 0, order[:, 1], -1) if len(alliances) > 1 else np.full(len(votes), -1)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            shares = votes / totals[:, None] * 100
+            margin_pct = (top - second) / totals * 100
+        derived = {'Total_Votes': totals}
+        derived.update({f'{a}_Share': shares[:, j] for j, a in enumerate(alliances)})
+        derived.update({
+            'Winner_Alliance': labels[winner],
+            'Runner_Up_Alliance': labels[runner_up],
+            'Winner_Votes': top,
+            'Runner_Up_Votes': second,
+            'Margin': top - second,
+            'Margin_Pct': margin_pct,
+        })
+        if 'Total_Voters' in base.columns:
+            electorate = base['Total_Voters'].to_numpy(dtype=np.float64)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                derived['Turnout'] = np.where(electorate > 0, totals / electorate * 100, np.nan)
+
+        # Positional lookup instead of a merge: one get_indexer over the 8 divisions
+        econ = get_economic_df().set_index('Division')
+        pos = econ.index.get_indexer(base['Division'].astype(str))
+        for col in ECONOMIC_COLUMNS:
+            values = econ[col].to_numpy()
+            derived[col] = values[pos] if (pos >= 0).all() else np.where(pos >= 0, values[pos], np.nan)
+
+        return pd.concat([base, pd.DataFrame(derived)], axis=1)
+
+def ensure_enriched(df):
+    """Returns ``df`` if it already carries the enriched columns, else its enriched copy."""
+    if all(c in df.columns for c in REQUIRED_COLUMNS):
+        return df
+    return enrich_seats(df)
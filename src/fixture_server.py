@@ -0,0 +1,109 @@
+import argparse
+import html
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+
+# Default source for the stand-in pages: the committed raw scrape
+DEFAULT_SOURCE = os.path.join("data", "raw_election_data.csv")
+
+STAT_LABELS = [
+    ("Total_Voters", "মোট ভোটার"),
+    ("Total_Centers", "মোট কেন্দ্র"),
+    ("Male_Voters", "পুরুষ ভোটার"),
+    ("Female_Voters", "নারী ভোটার"),
+]
+
+def render_seat_page(seat_rows):
+    """Renders one seat page using the same markup the live results site uses."""
+    first = seat_rows.iloc[0]
+    esc = lambda v: html.escape(str(v))
+
+    stats = "".join(
+        f'<div class="border-lightgray pa-2">'
+        f'<div class="text-subtitle-1">{label}</div>'
+        f'<div class="text-title-1 text-green">{esc(first[col])}</div></div>'
+        for col, label in STAT_LABELS
+    )
+    cards = "".join(
+        f'<div class="my-4 v-card">'
+        f'<div class="text-subtitle-1-display">{esc(row.Candidate)}</div>'
+        f'<p>দল: {esc(row.Party)}</p>'
+        f'<p>মার্কা: {esc(row.Symbol)}</p>'
+        f'<p>ভোট: {esc(row.Votes)}</p></div>'
+        for row in seat_rows.itertuples()
+    )
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Seat</title></head><body>'
+        f'<div class="text-h5 px-0">{esc(first["Seat_Name"])}, সংসদীয় আসন</div>'
+        f'<div class="stats">{stats}</div><div class="cards">{cards}</div>'
+        '</body></html>'
+    )
+
+def load_pages(source=DEFAULT_SOURCE):
+    """Pre-renders every seat page in a raw election CSV, keyed by Seat_ID."""
+    df = pd.read_csv(source, dtype=str)
+    return {
+        int(seat_id): render_seat_page(rows).encode("utf-8")
+        for seat_id, rows in df.groupby("Seat_ID", sort=False)
+    }
+
+def make_server(pages, host="127.0.0.1", port=8765, latency=0.0, failure_rate=0.0):
+    """Builds a threaded HTTP server that answers ``/seat/{id}`` from saved pages.
+
+    ``latency`` adds a fixed delay per response and ``failure_rate`` makes that
+    fraction of requests fail with a 503, so retries can be exercised locally.
+    """
+    class SeatHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            parts = self.path.strip("/").split("/")
+            body = None
+            if len(parts) == 2 and parts[0] == "seat" and parts[1].isdigit():
+                body = pages.get(int(parts[1]))
+            if latency:
+                time.sleep(latency)
+            if body is None or random.random() < failure_rate:
+                status, body = (404, b"Not Found") if body is None else (503, b"Unavailable")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain")
+            else:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), SeatHandler)
+    server.daemon_threads = True
+    return server
+
+def serve_in_background(source=DEFAULT_SOURCE, **kwargs):
+    """Starts the stand-in server on a daemon thread and returns (server, base_url)."""
+    server = make_server(load_pages(source), **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/seat/"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve saved seat pages as a local stand-in for the results site.")
+    parser.add_argument("--source", default=DEFAULT_SOURCE)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = make_server(load_pages(args.source), port=args.port,
+                         latency=args.latency, failure_rate=args.failure_rate)
+    print(f"🛰️  Serving seat pages on http://127.0.0.1:{args.port}/seat/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,327 @@
+import threading
+import time
+import numpy as np
+import pandas as pd
+from .config import ALLIANCE_COLUMNS, map_alliance_series
+from .numerals import NUMERIC_COLUMNS, VOTER_COLUMNS, parse_bengali_numbers, report_bad_counts
+from .profiling import span
+from .rollup import derive_metrics
+from .store import read_table, write_table
+from .visualize import build_chart_tasks, build_weighted_impact_tasks, render_charts
+from .weighted_analysis import division_table
+
+ALLIANCE_INDEX = {a: i for i, a in enumerate(ALLIANCE_COLUMNS)}
+
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
+class LiveSnapshot:
+    """One consistent, read-only state of the results.
+
+    Seat rows are indexed by position (``seat_pos[seat_id]``); ``seat_votes``
+    is seats x alliances in ``ALLIANCE_COLUMNS`` order, ``winners`` holds an
+    alliance position per seat (-1 while a seat has no votes), and the
+    division arrays are divisions x alliances. Readers grab
+    ``LiveResults.snapshot`` once and use it; updates never touch it.
+    """
+
+    def __init__(self, version, seat_ids, seat_pos, seat_names, seat_divisions, seat_voters, seat_votes, winners,
+                 divisions, division_votes, division_wins, changed_seats=()):
+        self.version = version
+        self.updated_at = time.time()
+        self.seat_ids = seat_ids
+        self.seat_pos = seat_pos
+        self.seat_names = seat_names
+        self.seat_divisions = seat_divisions
+        self.seat_voters = _readonly(seat_voters)
+        self.seat_votes = _readonly(seat_votes)
+        self.winners = _readonly(winners)
+        self.divisions = divisions
+        self.division_votes = _readonly(division_votes)
+        self.division_wins = _readonly(division_wins)
+        self.changed_seats = tuple(changed_seats)
+
+        # Division-level aggregates are divisions x alliances, so recomputing them is O(1) in seats
+        self.national_votes = division_votes.sum(axis=0)
+        metrics = derive_metrics(division_votes, self.national_votes.sum())
+        self.division_totals = metrics['Total_Votes']
+        self.division_share = metrics['Share']
+        self.voter_weight = metrics['Voter_Weight']
+        self.weighted_impact = metrics['Weighted']
+
+    def seat(self, seat_id):
+        """Alliance votes and winner of one seat, or None if unknown."""
+        i = self.seat_pos.get(int(seat_id))
+        if i is None:
+            return None
+        winner = self.winners[i]
+        return {
+            'Seat_ID': int(self.seat_ids[i]),
+            'Seat_Name': self.seat_names[i],
+            'Division': self.divisions[self.seat_divisions[i]],
+            'Votes': dict(zip(ALLIANCE_COLUMNS, self.seat_votes[i].tolist())),
+            'Winner_Alliance': ALLIANCE_COLUMNS[winner] if winner >= 0 else None,
+        }
+
+    def seat_wins(self):
+        return dict(zip(ALLIANCE_COLUMNS, self.division_wins.sum(axis=0).tolist()))
+
+    def seats_frame(self):
+        """Seat table in the shape of clean_and_process output, plus Winner_Alliance."""
+        df = pd.DataFrame({
+            'Seat_ID': self.seat_ids,
+            'Seat_Name': self.seat_names,
+            'Division': np.asarray(self.divisions, dtype=object)[self.seat_divisions],
+        })
+        df = pd.concat([df, pd.DataFrame(self.seat_votes, columns=ALLIANCE_COLUMNS),
+                        pd.DataFrame(self.seat_voters, columns=VOTER_COLUMNS)], axis=1)
+        labels = np.asarray(ALLIANCE_COLUMNS + [None], dtype=object)
+        df['Winner_Alliance'] = labels[self.winners]  # -1 picks the trailing None
+        return df
+
+    def division_frame(self):
+        """Division table in the shape of run_weighted_analysis output."""
+        return division_table(self.divisions, ALLIANCE_COLUMNS, self.division_totals,
+                              self.division_share, self.voter_weight, self.weighted_impact)
+
+class LiveResults:
+    """Applies per-seat result updates incrementally on results night.
+
+    Candidate votes are kept per seat, in report order (names may repeat
+    within a seat); an update recomputes only the touched
+    seats' alliance totals and winners and adds the differences to the
+    division sums, so its cost grows with the number of changed seats, not the
+    whole table. Each update builds a new LiveSnapshot and publishes it with a
+    single reference swap, so readers see either all of an update or none.
+
+    With ``output_dir``, a background thread re-renders charts from the newest
+    snapshot; the render cache skips every chart whose data did not change.
+    """
+
+    def __init__(self, raw, output_dir=None, preview=True, workers=1):
+        df = read_table(raw) if isinstance(raw, str) else raw
+        self._lock = threading.Lock()
+        self._candidates = {}
+        seat_keys = df.drop_duplicates('Seat_ID')[['Seat_ID', 'Seat_Name', 'Division']]
+        seat_ids = seat_keys['Seat_ID'].to_numpy(dtype=np.int64)
+        division_codes, divisions = pd.factorize(seat_keys['Division'].astype(str), sort=True)
+        n_seats, n_alliances = len(seat_ids), len(ALLIANCE_COLUMNS)
+        self._seat_pos = {int(s): i for i, s in enumerate(seat_ids)}
+
+        seat_votes = np.zeros((n_seats, n_alliances), dtype=np.int64)
+        seat_voters = np.zeros((n_seats, len(VOTER_COLUMNS)), dtype=np.int64)
+        for seat_id, (candidates, voters) in self._seat_reports(df).items():
+            i = self._seat_pos[seat_id]
+            self._candidates[seat_id] = candidates
+            seat_votes[i] = self._seat_vector(candidates)
+            seat_voters[i] = voters
+
+        winners = self._winners(seat_votes)
+        division_votes = np.zeros((len(divisions), n_alliances), dtype=np.int64)
+        np.add.at(division_votes, division_codes, seat_votes)
+        division_wins = np.zeros((len(divisions), n_alliances), dtype=np.int64)
+        won = winners >= 0
+        np.add.at(division_wins, (division_codes[won], winners[won]), 1)
+
+        seat_names = seat_keys['Seat_Name'].astype(str).tolist()
+        self.snapshot = LiveSnapshot(0, seat_ids, self._seat_pos, seat_names, division_codes, seat_voters,
+                                     seat_votes, winners, list(divisions), division_votes, division_wins)
+
+        self.output_dir = output_dir
+        self.preview = preview
+        self.workers = workers
+        self.rendered_version = -1
+        # Newest version the background renderer has finished a pass for (even a failed one)
+        self._render_done_version = -1
+        self._render_cond = threading.Condition()
+        if output_dir:
+            threading.Thread(target=self._render_loop, daemon=True).start()
+
+    # --- Parsing seat reports ---
+
+    @staticmethod
+    def _seat_reports(df):
+        """Splits raw rows into ``{seat_id: ([[candidate, alliance_pos, votes], ...], voter figures)}``.
+
+        Candidates stay in row order rather than keyed by name: a seat can list
+        two candidates with the same name (seat 92 does).
+        """
+        missing = {'Seat_ID', 'Seat_Name', 'Division', 'Candidate', 'Party', 'Votes'} - set(df.columns)
+        if missing:
+            raise ValueError(f"Seat report is missing columns: {sorted(missing)}")
+        numbers, bad = parse_bengali_numbers(df, NUMERIC_COLUMNS, report=False)
+        report_bad_counts(bad)
+        alliances = map_alliance_series(df['Party']).map(ALLIANCE_INDEX).to_numpy(dtype=np.int64)
+        votes = numbers['Votes'].to_numpy(dtype=np.int64)
+        voters = np.zeros((len(df), len(VOTER_COLUMNS)), dtype=np.int64)
+        for j, col in enumerate(VOTER_COLUMNS):
+            if col in numbers.columns:
+                voters[:, j] = numbers[col].to_numpy(dtype=np.int64)
+
+        reports = {}
+        for i, (seat_id, candidate) in enumerate(zip(df['Seat_ID'].astype(np.int64), df['Candidate'].astype(str))):
+            candidates, _ = reports.setdefault(int(seat_id), ([], voters[i]))
+            candidates.append([candidate, int(alliances[i]), int(votes[i])])
+        return reports
+
+    @staticmethod
+    def _seat_vector(candidates):
+        vector = np.zeros(len(ALLIANCE_COLUMNS), dtype=np.int64)
+        for _, alliance, votes in candidates:
+            vector[alliance] += votes
+        return vector
+
+    @staticmethod
+    def _winners(seat_votes):
+        return np.where(seat_votes.sum(axis=1) > 0, seat_votes.argmax(axis=1), -1)
+
+    # --- Updates ---
+
+    def update(self, deltas):
+        """Sets candidate vote counts, e.g. ``{12: {'Candidate A': 51234}}``, and publishes a snapshot.
+
+        A candidate is addressed by name, or by its position in the seat's
+        report when the name is shared by several candidates of that seat.
+        """
+        changes = {}
+        for seat_id, counts in deltas.items():
+            seat_id = int(seat_id)
+            if seat_id not in self._candidates:
+                raise KeyError(f"Unknown seat {seat_id}; send a full seat report instead")
+            candidates = [list(c) for c in self._candidates[seat_id]]
+            for key, votes in counts.items():
+                candidates[self._candidate_pos(seat_id, candidates, key)][2] = int(votes)
+            changes[seat_id] = (candidates, None, None)
+        return self._apply(changes)
+
+    @staticmethod
+    def _candidate_pos(seat_id, candidates, key):
+        if isinstance(key, (int, np.integer)):
+            if not 0 <= key < len(candidates):
+                raise KeyError(f"No candidate at position {key} in seat {seat_id}")
+            return int(key)
+        matches = [i for i, (name, _, _) in enumerate(candidates) if name == key]
+        if not matches:
+            raise KeyError(f"Unknown candidate {key!r} in seat {seat_id}")
+        if len(matches) > 1:
+            raise ValueError(f"Candidate name {key!r} is ambiguous in seat {seat_id}; "
+                             f"address it by position ({matches})")
+        return matches[0]
+
+    def report(self, rows):
+        """Replaces whole seats from raw-schema rows (e.g. a fresh scrape of a few seats).
+
+        Seats not seen before are added; their Seat_Name and Division come from the rows.
+        """
+        reports = self._seat_reports(rows)
+        keys = rows.drop_duplicates('Seat_ID').set_index('Seat_ID')
+        keys.index = keys.index.astype(np.int64)
+        changes = {}
+        for seat_id, (candidates, voters) in reports.items():
+            changes[seat_id] = (candidates, voters, (str(keys.at[seat_id, 'Seat_Name']), str(keys.at[seat_id, 'Division'])))
+        return self._apply(changes)
+
+    def _apply(self, changes):
+        with self._lock, span("live:update", seats=len(changes)) as info:
+            old = self.snapshot
+            seat_ids, seat_names, seat_divisions = old.seat_ids, old.seat_names, old.seat_divisions
+            seat_voters, divisions = old.seat_voters, old.divisions
+            seat_pos = self._seat_pos
+
+            # New seats/divisions are rare; growing the arrays is the only O(seats) step
+            new_seats = [s for s in changes if s not in seat_pos]
+            new_divisions = sorted({changes[s][2][1] for s in new_seats} - set(divisions))
+            if new_divisions:
+                divisions = divisions + new_divisions
+            if new_seats:
+                division_code = {d: i for i, d in enumerate(divisions)}
+                seat_pos = dict(seat_pos)  # published snapshots keep their own mapping
+                for seat_id in new_seats:
+                    seat_pos[seat_id] = len(seat_pos)
+                seat_ids = np.concatenate([seat_ids, np.array(new_seats, dtype=np.int64)])
+                seat_names = seat_names + [changes[s][2][0] for s in new_seats]
+                seat_divisions = np.concatenate([seat_divisions, [division_code[changes[s][2][1]] for s in new_seats]])
+                seat_voters = np.vstack([seat_voters, np.zeros((len(new_seats), len(VOTER_COLUMNS)), dtype=np.int64)])
+
+            n_seats, n_divisions = len(seat_ids), len(divisions)
+            seat_votes = np.zeros((n_seats, len(ALLIANCE_COLUMNS)), dtype=np.int64)
+            seat_votes[:len(old.seat_ids)] = old.seat_votes
+            winners = np.full(n_seats, -1, dtype=np.int64)
+            winners[:len(old.seat_ids)] = old.winners
+            division_votes = np.zeros((n_divisions, len(ALLIANCE_COLUMNS)), dtype=np.int64)
+            division_votes[:len(old.divisions)] = old.division_votes
+            division_wins = np.zeros_like(division_votes)
+            division_wins[:len(old.divisions)] = old.division_wins
+            if any(voters is not None for _, voters, _ in changes.values()):
+                seat_voters = seat_voters.copy()
+
+            for seat_id, (candidates, voters, _) in changes.items():
+                i = seat_pos[seat_id]
+                d = seat_divisions[i]
+                vector = self._seat_vector(candidates)
+                division_votes[d] += vector - seat_votes[i]
+                seat_votes[i] = vector
+                if winners[i] >= 0:
+                    division_wins[d, winners[i]] -= 1
+                winners[i] = vector.argmax() if vector.sum() > 0 else -1
+                if winners[i] >= 0:
+                    division_wins[d, winners[i]] += 1
+                if voters is not None:
+                    seat_voters[i] = voters
+
+            snapshot = LiveSnapshot(old.version + 1, seat_ids, seat_pos, seat_names, seat_divisions, seat_voters,
+                                    seat_votes, winners, divisions, division_votes, division_wins,
+                                    changed_seats=changes)
+            info['version'] = snapshot.version
+
+            # Commit: nothing above touched the published state
+            for seat_id, (candidates, _, _) in changes.items():
+                self._candidates[seat_id] = candidates
+            self._seat_pos = seat_pos
+            self.snapshot = snapshot
+        if self.output_dir:
+            with self._render_cond:
+                self._render_cond.notify_all()
+        return snapshot
+
+    # --- Outputs ---
+
+    def save(self, seats_path, division_path, export_csv=None):
+        """Writes the current snapshot as the seat and division tables (CSV or columnar store)."""
+        snapshot = self.snapshot
+        write_table(snapshot.seats_frame(), seats_path, export_csv=export_csv)
+        write_table(snapshot.division_frame(), division_path, export_csv=export_csv)
+        return snapshot.version
+
+    def render(self, output_dir=None, preview=None):
+        """Re-renders the charts affected since the last render; returns the re-rendered paths."""
+        snapshot = self.snapshot
+        output_dir = output_dir or self.output_dir
+        preview = self.preview if preview is None else preview
+        with span("live:render", version=snapshot.version):
+            tasks = build_chart_tasks(snapshot.seats_frame()) + build_weighted_impact_tasks(snapshot.division_frame())
+            rendered = render_charts(tasks, output_dir, workers=self.workers, preview=preview)
+        self.rendered_version = snapshot.version
+        return rendered
+
+    def _render_loop(self):
+        # Bursts of updates coalesce: each pass renders only the newest snapshot
+        while True:
+            with self._render_cond:
+                self._render_cond.wait_for(lambda: self._render_done_version < self.snapshot.version)
+                target = self.snapshot.version
+            try:
+                self.render()
+            except Exception as e:
+                print(f"⚠️ Live chart render failed: {e}")
+            with self._render_cond:
+                self._render_done_version = max(target, self.rendered_version)
+                self._render_cond.notify_all()
+
+    def wait_rendered(self, timeout=None):
+        """Blocks until the background renderer has caught up with the latest update."""
+        if not self.output_dir:
+            return True
+        with self._render_cond:
+            return self._render_cond.wait_for(lambda: self._render_done_version >= self.snapshot.version, timeout)
@@ -0,0 +1,286 @@
+import hashlib
+import itertools
+import json
+import os
+import numpy as np
+import pandas as pd
+import joblib
+from joblib import Parallel, delayed
+import sklearn
+from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+from sklearn.inspection import permutation_importance
+from sklearn.metrics import balanced_accuracy_score
+from sklearn.model_selection import RepeatedStratifiedKFold
+from sklearn.tree import DecisionTreeClassifier
+from .enrich import ensure_enriched
+from .profiling import span
+
+CACHE_DIR = os.path.join("data", "cache", "model_eval")
+CLASSES = ['BNP-A', '11PA']
+
+# Seat-level features; vote shares are left out because they define the winner
+FEATURES = ['Monthly_Income', 'Expenditure', 'Turnout', 'Total_Voters', 'Female_Share', 'Voters_Per_Center']
+# Bootstrap seeds per cached task; fixed so cache keys do not depend on the machine or worker count
+BOOTSTRAP_CHUNK = 25
+
+MODELS = {
+    'tree': DecisionTreeClassifier,
+    'random_forest': RandomForestClassifier,
+    'extra_trees': ExtraTreesClassifier,
+    'gradient_boosting': GradientBoostingClassifier,
+}
+PARAM_GRIDS = {
+    'tree': {'max_depth': [2, 3, 4, 6], 'min_samples_leaf': [1, 5, 15]},
+    'random_forest': {'n_estimators': [200], 'max_depth': [3, 6, None], 'min_samples_leaf': [1, 5]},
+    'extra_trees': {'n_estimators': [200], 'max_depth': [3, 6, None], 'min_samples_leaf': [1, 5]},
+    'gradient_boosting': {'n_estimators': [100, 200], 'max_depth': [2, 3], 'learning_rate': [0.05, 0.1]},
+}
+
+def build_features(df, features=FEATURES):
+    """Builds the (X, y, feature names) matrix once from enriched seats won by BNP-A or 11PA.
+
+    ``features`` picks columns, in order, from the seat columns and the derived
+    Female_Share / Voters_Per_Center; any the data cannot provide are dropped.
+    """
+    df = ensure_enriched(df)
+    df = df[df['Winner_Alliance'].isin(CLASSES)]
+    available = {c: df[c] for c in df.columns}
+    if {'Female_Voters', 'Total_Voters', 'Total_Centers'} <= set(df.columns):
+        voters = df['Total_Voters'].to_numpy(dtype=np.float64)
+        available['Female_Share'] = np.divide(df['Female_Voters'].to_numpy(dtype=np.float64), voters,
+                                              out=np.full(len(df), np.nan), where=voters > 0)
+        centers = df['Total_Centers'].to_numpy(dtype=np.float64)
+        available['Voters_Per_Center'] = np.divide(voters, centers, out=np.full(len(df), np.nan), where=centers > 0)
+    features = pd.DataFrame({f: available[f] for f in features if f in available}, index=df.index)
+    features = features.dropna(axis=1, how='all')
+    keep = features.notna().all(axis=1).to_numpy()
+    X = np.ascontiguousarray(features[keep].to_numpy(dtype=np.float64))
+    y = (df['Winner_Alliance'][keep] == '11PA').to_numpy(dtype=np.int8)
+    return X, y, list(features.columns)
+
+def _data_hash(X, y, feature_names):
+    h = hashlib.sha256()
+    h.update(X.tobytes())
+    h.update(y.tobytes())
+    h.update(json.dumps([feature_names, list(X.shape), sklearn.__version__]).encode())
+    return h.hexdigest()
+
+def _task_key(data_hash, kind, spec):
+    return hashlib.sha256(json.dumps([data_hash, kind, spec], sort_keys=True, default=str).encode()).hexdigest()
+
+def _load_cached(cache_dir, key):
+    try:
+        with open(os.path.join(cache_dir, f"{key}.json"), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_cached(cache_dir, key, result):
+    path = os.path.join(cache_dir, f"{key}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+    os.replace(tmp_path, path)
+
+def _splits(y, n_splits, n_repeats, seed):
+    cv = RepeatedStratifiedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=seed)
+    return list(cv.split(np.zeros(len(y)), y))
+
+def _make_model(name, params, seed):
+    return MODELS[name](random_state=seed, **params)
+
+# --- Worker tasks: X arrives as a read-only memmap shared by every worker ---
+
+def _cv_task(X_path, y, name, params, splits, seed):
+    """Balanced accuracy of one model/parameter set on every CV fold."""
+    X = joblib.load(X_path, mmap_mode='r')
+    scores = []
+    for train, test in splits:
+        model = _make_model(name, params, seed).fit(X[train], y[train])
+        scores.append(balanced_accuracy_score(y[test], model.predict(X[test])))
+    return {'scores': scores, 'mean': float(np.mean(scores)), 'std': float(np.std(scores))}
+
+def _importance_task(X_path, y, name, params, splits, n_repeats, seed):
+    """Permutation importance on held-out folds, averaged over folds."""
+    X = joblib.load(X_path, mmap_mode='r')
+    per_fold = []
+    for train, test in splits:
+        model = _make_model(name, params, seed).fit(X[train], y[train])
+        result = permutation_importance(model, X[test], y[test], scoring='balanced_accuracy',
+                                        n_repeats=n_repeats, random_state=seed)
+        per_fold.append(result.importances_mean)
+    per_fold = np.array(per_fold)
+    return {'mean': per_fold.mean(axis=0).tolist(), 'std': per_fold.std(axis=0).tolist()}
+
+def _bootstrap_task(X_path, y, params, seeds, reference):
+    """Fits trees on bootstrap resamples and records their root split and feature usage."""
+    X = joblib.load(X_path, mmap_mode='r')
+    roots, thresholds, used, agreement = [], [], [], []
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        idx = rng.integers(0, len(y), len(y))
+        tree = DecisionTreeClassifier(random_state=0, **params).fit(X[idx], y[idx])
+        root = int(tree.tree_.feature[0])
+        roots.append(root)
+        thresholds.append(float(tree.tree_.threshold[0]) if root >= 0 else None)
+        used.append(sorted({int(f) for f in tree.tree_.feature if f >= 0}))
+        agreement.append(float((tree.predict(X) == reference).mean()))
+    return {'roots': roots, 'thresholds': thresholds, 'used': used, 'agreement': agreement}
+
+# --- Engine ---
+
+def _run_cached(tasks, cache_dir, workers):
+    """Runs ``{key: delayed call}`` tasks in parallel, reusing any result already cached under its key."""
+    results = {key: _load_cached(cache_dir, key) for key in tasks}
+    missing = [key for key, value in results.items() if value is None]
+    if missing:
+        outputs = Parallel(n_jobs=workers or -1)(tasks[key] for key in missing)
+        for key, value in zip(missing, outputs):
+            _save_cached(cache_dir, key, value)
+            results[key] = value
+    return results, len(missing)
+
+def evaluate_models(df, models=None, param_grids=None, n_splits=5, cv_repeats=3, importance_repeats=20,
+                    n_bootstrap=200, seed=42, workers=None, cache_dir=CACHE_DIR):
+    """Cross-validated grid search, permutation importance and tree-rule stability.
+
+    Every (model, parameters) pair is scored with repeated stratified K-fold
+    balanced accuracy; each family's best setting then gets held-out
+    permutation importances, and the best tree is refit on ``n_bootstrap``
+    resamples to see how often the same root split comes back. The feature
+    matrix is built once and memory-mapped read-only into the joblib workers,
+    and every task result is cached under a hash of the data and its
+    parameters, so a rerun only computes what changed.
+    """
+    models = models or list(MODELS)
+    param_grids = {**PARAM_GRIDS, **(param_grids or {})}
+    X, y, feature_names = build_features(df)
+    if len(np.unique(y)) < 2:
+        print("Not enough data for binary classification.")
+        return None
+    data_hash = _data_hash(X, y, feature_names)
+    os.makedirs(cache_dir, exist_ok=True)
+    X_path = os.path.join(cache_dir, f"X_{data_hash[:16]}.joblib")
+    if not os.path.exists(X_path):
+        joblib.dump(X, X_path)
+
+    n_splits = min(n_splits, int(np.bincount(y).min()))
+    splits = _splits(y, n_splits, cv_repeats, seed)
+    cv_spec = {'n_splits': n_splits, 'repeats': cv_repeats, 'seed': seed}
+    computed = 0
+
+    # 1. Grid search
+    with span("model_eval:grid", rows=len(y)) as info:
+        grid_tasks, grid_rows = {}, []
+        for name in models:
+            keys, values = zip(*param_grids[name].items())
+            for combo in itertools.product(*values):
+                params = dict(zip(keys, combo))
+                key = _task_key(data_hash, 'cv', [name, params, cv_spec])
+                grid_tasks[key] = delayed(_cv_task)(X_path, y, name, params, splits, seed)
+                grid_rows.append((name, params, key))
+        grid_results, n = _run_cached(grid_tasks, cache_dir, workers)
+        computed += n
+        info['tasks'], info['computed'] = len(grid_tasks), n
+    grid = pd.DataFrame([{'model': name, 'params': params, 'mean': grid_results[key]['mean'],
+                          'std': grid_results[key]['std']} for name, params, key in grid_rows])
+    best = {name: rows.loc[rows['mean'].idxmax()] for name, rows in grid.groupby('model', sort=False)}
+
+    # 2. Permutation importance of each family's best setting
+    with span("model_eval:importance") as info:
+        importance_tasks = {}
+        for name, row in best.items():
+            key = _task_key(data_hash, 'importance', [name, row['params'], cv_spec, importance_repeats])
+            importance_tasks[key] = delayed(_importance_task)(X_path, y, name, row['params'], splits,
+                                                              importance_repeats, seed)
+        importance_results, n = _run_cached(importance_tasks, cache_dir, workers)
+        computed += n
+        info['computed'] = n
+    importance_keys = list(importance_tasks)
+    importance = pd.DataFrame(
+        [importance_results[k]['mean'] for k in importance_keys], index=list(best), columns=feature_names)
+    importance_std = pd.DataFrame(
+        [importance_results[k]['std'] for k in importance_keys], index=list(best), columns=feature_names)
+
+    # 3. Bootstrap stability of the best tree's rules, in seed chunks across workers
+    stability = None
+    if 'tree' in best:
+        tree_params = best['tree']['params']
+        reference = DecisionTreeClassifier(random_state=0, **tree_params).fit(X, y).predict(X)
+        seeds = np.random.SeedSequence(seed).generate_state(n_bootstrap).tolist()
+        with span("model_eval:bootstrap", resamples=n_bootstrap) as info:
+            boot_tasks = {}
+            for start in range(0, len(seeds), BOOTSTRAP_CHUNK):
+                chunk = [int(s) for s in seeds[start:start + BOOTSTRAP_CHUNK]]
+                key = _task_key(data_hash, 'bootstrap', [tree_params, chunk])
+                boot_tasks[key] = delayed(_bootstrap_task)(X_path, y, tree_params, chunk, reference)
+            boot_results, n = _run_cached(boot_tasks, cache_dir, workers)
+            computed += n
+            info['computed'] = n
+        roots = [r for res in boot_results.values() for r in res['roots']]
+        thresholds = [t for res in boot_results.values() for t in res['thresholds']]
+        used = [u for res in boot_results.values() for u in res['used']]
+        agreement = [a for res in boot_results.values() for a in res['agreement']]
+        # Stumps (root == -1) have no split; they only count in prediction agreement
+        root_counts = pd.Series([feature_names[r] for r in roots if r >= 0], dtype=object).value_counts(normalize=True)
+        root_threshold = None
+        if len(root_counts):
+            top_root = root_counts.index[0]
+            top_thresholds = [t for r, t in zip(roots, thresholds) if r >= 0 and feature_names[r] == top_root]
+            root_threshold = {'feature': top_root, 'median': float(np.median(top_thresholds)),
+                              'q25': float(np.percentile(top_thresholds, 25)),
+                              'q75': float(np.percentile(top_thresholds, 75))}
+        stability = {
+            'params': tree_params,
+            'root_feature_frequency': root_counts.to_dict(),
+            'root_threshold': root_threshold,
+            'feature_usage': {f: float(np.mean([i in u for u in used])) for i, f in enumerate(feature_names)},
+            'prediction_agreement': float(np.mean(agreement)),
+        }
+
+    return {
+        'features': feature_names,
+        'n_samples': int(len(y)),
+        'class_counts': {CLASSES[0]: int((y == 0).sum()), CLASSES[1]: int((y == 1).sum())},
+        'data_hash': data_hash,
+        'grid': grid,
+        'best': {name: {'params': row['params'], 'mean': row['mean'], 'std': row['std']} for name, row in best.items()},
+        'importance': importance,
+        'importance_std': importance_std,
+        'stability': stability,
+        'computed_tasks': computed,
+    }
+
+def print_report(result):
+    """Prints the model comparison, importances and rule stability."""
+    if result is None:
+        return
+    print(f"\n--- Model Evaluation ({result['n_samples']} seats, {result['class_counts']}) ---")
+    print("Best cross-validated balanced accuracy per model:")
+    for name, best in sorted(result['best'].items(), key=lambda kv: -kv[1]['mean']):
+        print(f"  {name:<18} {best['mean']:.3f} ± {best['std']:.3f}  {best['params']}")
+    print("\nPermutation importance (drop in balanced accuracy on held-out folds):")
+    print(result['importance'].round(3).to_string())
+    stability = result['stability']
+    if stability:
+        print(f"\nTree rule stability over bootstrap resamples ({stability['params']}):")
+        for feature, freq in stability['root_feature_frequency'].items():
+            print(f"  root split on {feature}: {freq:.0%}")
+        t = stability['root_threshold']
+        if t is None:
+            print("  every resampled tree is a stump (no split)")
+        else:
+            print(f"  {t['feature']} threshold: median {t['median']:.1f} (IQR {t['q25']:.1f} - {t['q75']:.1f})")
+        print(f"  predictions agree with the full-data tree on {stability['prediction_agreement']:.0%} of seats")
+    print(f"\n{result['computed_tasks']} task(s) computed, the rest served from cache.")
+
+def save_report(result, path):
+    """Writes the evaluation summary as JSON."""
+    summary = {k: v for k, v in result.items() if k not in ('grid', 'importance', 'importance_std')}
+    summary['grid'] = result['grid'].to_dict(orient='records')
+    summary['importance'] = result['importance'].to_dict(orient='index')
+    summary['importance_std'] = result['importance_std'].to_dict(orient='index')
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, default=str)
+    os.replace(tmp_path, path)
@@ -0,0 +1,46 @@
+import pandas as pd
+
+# Built once; str.translate in pandas applies it to the whole column in C
+BENGALI_DIGITS = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
+
+# Raw scrape columns that hold Bengali-numeral counts
+VOTER_COLUMNS = ['Total_Voters', 'Total_Centers', 'Male_Voters', 'Female_Voters']
+NUMERIC_COLUMNS = ['Votes'] + VOTER_COLUMNS
+
+def parse_bengali_numbers(df, columns=NUMERIC_COLUMNS, report=True):
+    """Parses Bengali-numeral columns into compact integers in one batched pass.
+
+    Thousands separators and surrounding whitespace are ignored, blanks become
+    0, and anything else that is not a whole number is counted as malformed and
+    also set to 0. Returns ``(parsed_df, bad_counts)`` where ``bad_counts`` maps
+    each column to its number of malformed values.
+    """
+    columns = [c for c in columns if c in df.columns]
+    if not columns:
+        return pd.DataFrame(index=df.index), {}
+
+    # Stack every column so the translate/strip/parse work runs once
+    stacked = pd.concat([df[c] for c in columns], ignore_index=True).astype('string')
+    cleaned = (stacked.str.translate(BENGALI_DIGITS)
+                      .str.replace(',', '', regex=False)
+                      .str.strip())
+    blank = cleaned.isna() | (cleaned == '')
+    numbers = pd.to_numeric(cleaned.mask(blank), errors='coerce')
+    bad = ~blank & (numbers.isna() | (numbers % 1 != 0))
+    numbers = numbers.mask(bad).fillna(0).astype('int64').to_numpy()
+    bad = bad.to_numpy()
+
+    n = len(df)
+    parsed, bad_counts = {}, {}
+    for i, col in enumerate(columns):
+        parsed[col] = pd.to_numeric(pd.Series(numbers[i * n:(i + 1) * n], index=df.index), downcast='integer')
+        bad_counts[col] = int(bad[i * n:(i + 1) * n].sum())
+    if report:
+        report_bad_counts(bad_counts)
+    return pd.DataFrame(parsed, index=df.index), bad_counts
+
+def report_bad_counts(bad_counts):
+    """Prints one warning per column that had malformed values."""
+    for col, count in bad_counts.items():
+        if count:
+            print(f"⚠️  {col}: {count} malformed value(s) set to 0")
@@ -0,0 +1,318 @@
+import hashlib
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from .profiling import span, start_trace_run, trace_dir, write_chrome_trace
+from .store import STORE_SUFFIX, content_files, is_store
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CORE_CHART_FILES = [
+    'Seat_Share_Pie_Chart_Improved.png',
+    'Division_Seat_Wins_Bar_Chart_Improved.png',
+    'Income_vs_BNP_Vote_Share_Scatter_Improved.png',
+    'Income_vs_Jamaat_Vote_Share_Scatter_Improved.png',
+    'Expenditure_vs_Winner_Boxplot_Improved.png',
+]
+WEIGHTED_CHART_FILES = ['weighted_impact_bnp-a.png', 'weighted_impact_11pa.png']
+
+class Stage:
+    """One node of the pipeline graph.
+
+    ``func`` is a ``"module:function"`` reference that is only imported when the
+    stage actually runs. ``inputs``/``outputs`` are keys into the paths dict,
+    and ``code`` lists the source files whose edits should invalidate it.
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), deps=(), code=(), params=None,
+                 satisfied_by=(), fallback_inputs=(), always=False):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.deps = list(deps)
+        self.code = list(code)
+        self.params = params or {}
+        # Stage is considered done whenever any of these paths already exists
+        self.satisfied_by = list(satisfied_by)
+        # Stage may still run from these when its regular inputs are missing
+        self.fallback_inputs = list(fallback_inputs)
+        # Stage runs whenever it is selected; its body decides what is stale
+        self.always = always
+
+def default_paths(base_dir, data_dir=None, images_dir=None):
+    """Standard data/ and images/ locations relative to the project root (either may be overridden)."""
+    data_dir = data_dir or os.path.join(base_dir, 'data')
+    images_dir = images_dir or os.path.join(base_dir, 'images')
+    paths = {
+        'raw': os.path.join(data_dir, 'raw_election_data.csv'),
+        'seats': os.path.join(data_dir, 'seat_wise_votes.csv'),
+        'division': os.path.join(data_dir, 'division_analysis.csv'),
+        'raw_store': os.path.join(data_dir, 'raw_election_data' + STORE_SUFFIX),
+        'seats_store': os.path.join(data_dir, 'seat_wise_votes' + STORE_SUFFIX),
+        'division_store': os.path.join(data_dir, 'division_analysis' + STORE_SUFFIX),
+        'enriched_store': os.path.join(data_dir, 'seat_enriched' + STORE_SUFFIX),
+        'images': images_dir,
+        'manifest': os.path.join(data_dir, '.pipeline_manifest.json'),
+        'model_eval': os.path.join(data_dir, 'model_evaluation.json'),
+        'model_cache': os.path.join(data_dir, 'cache', 'model_eval'),
+    }
+    for name in CORE_CHART_FILES + WEIGHTED_CHART_FILES:
+        paths[name] = os.path.join(images_dir, name)
+    return {k: os.path.normpath(v) for k, v in paths.items()}
+
+def build_stages(export_csv=True, evaluate=False, scrape=None):
+    """Declares the scrape -> process -> enrich -> weighted / model / charts graph.
+
+    Intermediate tables travel between stages as columnar stores; with
+    ``export_csv`` the seat and division tables are also written as CSV.
+    ``evaluate`` adds the (minutes-long) cross-validated model evaluation.
+    Without ``scrape`` the scrape stage only runs when no raw data exists;
+    given a dict of ``run_scraper`` options it always runs, as an incremental
+    refresh of the seat cache.
+    """
+    params = {'export_csv': export_csv}
+    if scrape is None:
+        scrape_stage = Stage('scrape', 'src.pipeline:_stage_scrape',
+                             outputs=['raw'], satisfied_by=['raw', 'seats'])
+    else:
+        scrape_stage = Stage('scrape', 'src.pipeline:_stage_scrape',
+                             outputs=['raw'], params=scrape, always=True)
+    stages = [
+        scrape_stage,
+        Stage('process', 'src.pipeline:_stage_process',
+              inputs=['raw'], outputs=['raw_store', 'seats_store'], deps=['scrape'],
+              code=['process_data.py', 'config.py', 'numerals.py', 'store.py'],
+              params=params, fallback_inputs=['seats']),
+        Stage('enrich', 'src.pipeline:_stage_enrich',
+              inputs=['seats_store'], outputs=['enriched_store'], deps=['process'],
+              code=['enrich.py', 'config.py', 'store.py']),
+        Stage('weighted', 'src.pipeline:_stage_weighted',
+              inputs=['enriched_store'], outputs=['division_store'], deps=['enrich'],
+              code=['weighted_analysis.py', 'rollup.py', 'enrich.py', 'config.py', 'store.py'], params=params),
+        Stage('model', 'src.pipeline:_stage_model',
+              inputs=['enriched_store'], deps=['enrich'],
+              code=['analyze.py', 'enrich.py']),
+        Stage('charts', 'src.pipeline:_stage_charts',
+              inputs=['enriched_store'], outputs=CORE_CHART_FILES, deps=['enrich'],
+              code=['visualize.py', 'enrich.py']),
+        Stage('weighted_charts', 'src.pipeline:_stage_weighted_charts',
+              inputs=['division_store'], outputs=WEIGHTED_CHART_FILES, deps=['weighted'],
+              code=['visualize.py', 'store.py']),
+    ]
+    if evaluate:
+        stages.append(Stage('evaluate', 'src.pipeline:_stage_evaluate',
+                            inputs=['enriched_store'], outputs=['model_eval'], deps=['enrich'],
+                            code=['model_eval.py', 'enrich.py']))
+    return stages
+
+# --- Stage bodies (module level so they can run in worker processes) ---
+
+def _stage_scrape(paths, **options):
+    from .scraper import cache_dir_for, run_scraper
+    if not os.path.exists(paths['raw']):
+        print(f"Raw data not found at {paths['raw']}. Scraping data...")
+    run_scraper(output_file=paths['raw'], cache_dir=cache_dir_for(paths['raw']), **options)
+
+def _stage_process(paths, export_csv=True):
+    import pandas as pd
+    from .process_data import clean_and_process
+    from .store import read_table, save_table
+    if not os.path.exists(paths['raw']):
+        # Only the processed CSV is available: bring it into the store as-is
+        save_table(pd.read_csv(paths['seats']), paths['seats_store'])
+        return
+    save_table(read_table(paths['raw']), paths['raw_store'])
+    df_seats = clean_and_process(paths['raw_store'])
+    if df_seats is not None:
+        save_table(df_seats, paths['seats_store'])
+        if export_csv:
+            df_seats.to_csv(paths['seats'], index=False)
+        print(f"✅ Created {paths['seats_store']}")
+
+def _stage_enrich(paths):
+    from .enrich import enrich_seats
+    from .store import load_table, save_table
+    save_table(enrich_seats(load_table(paths['seats_store'])), paths['enriched_store'])
+    print(f"✅ Created {paths['enriched_store']}")
+
+def _stage_weighted(paths, export_csv=True):
+    from .weighted_analysis import run_weighted_analysis
+    run_weighted_analysis(paths['enriched_store'], paths['division_store'],
+                          export_csv=paths['division'] if export_csv else None)
+
+def _stage_model(paths):
+    from .analyze import run_decision_tree_analysis
+    from .store import load_table
+    run_decision_tree_analysis(load_table(paths['enriched_store']))
+
+def _stage_evaluate(paths):
+    from .model_eval import evaluate_models, print_report, save_report
+    from .store import load_table
+    result = evaluate_models(load_table(paths['enriched_store']), cache_dir=paths['model_cache'])
+    print_report(result)
+    if result is not None:
+        save_report(result, paths['model_eval'])
+
+def _stage_charts(paths):
+    from .store import load_table
+    from .visualize import generate_charts
+    generate_charts(load_table(paths['enriched_store']), output_dir=paths['images'])
+
+def _stage_weighted_charts(paths):
+    from .visualize import generate_weighted_impact_chart
+    generate_weighted_impact_chart(paths['division_store'], output_dir=paths['images'])
+
+def _run_stage(name, func, paths, params):
+    with span(f"stage:{name}"):
+        module_name, func_name = func.split(':')
+        getattr(importlib.import_module(module_name), func_name)(paths, **params)
+
+# --- Fingerprinting ---
+
+def _file_hash(path, _cache={}):
+    """SHA-256 of a file's bytes (or a store's live files), memoized on (path, size, mtime)."""
+    if is_store(path):
+        h = hashlib.sha256()
+        for file_path in content_files(path):
+            h.update(f"{os.path.basename(file_path)}:{_file_hash(file_path)}".encode())
+        return h.hexdigest()
+    if os.path.isdir(path):
+        h = hashlib.sha256()
+        for name in sorted(os.listdir(path)):
+            h.update(f"{name}:{_file_hash(os.path.join(path, name))}".encode())
+        return h.hexdigest()
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    if key not in _cache:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        _cache[key] = h.hexdigest()
+    return _cache[key]
+
+def stage_fingerprint(stage, paths):
+    """Hashes a stage's input files, code files and parameters."""
+    h = hashlib.sha256(stage.name.encode())
+    for key in stage.inputs + stage.fallback_inputs:
+        if os.path.exists(paths[key]):
+            h.update(f"in:{key}:{_file_hash(paths[key])}".encode())
+    for name in stage.code:
+        h.update(f"code:{name}:{_file_hash(os.path.join(SRC_DIR, name))}".encode())
+    h.update(json.dumps(stage.params, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+def load_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(path, manifest):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+# --- Scheduler ---
+
+def run_pipeline(paths, stages=None, force=(), workers=None):
+    """Runs every stage whose fingerprint changed, independent stages in parallel.
+
+    A stage is skipped when its recorded fingerprint matches and the outputs it
+    produced last time still exist. ``force`` names stages to rerun regardless.
+    """
+    stages = stages or build_stages()
+    if trace_dir():
+        start_trace_run()
+    by_name = {s.name: s for s in stages}
+    manifest = load_manifest(paths['manifest'])
+    os.makedirs(os.path.dirname(paths['manifest']), exist_ok=True)
+    os.makedirs(paths['images'], exist_ok=True)
+
+    done, failed, running = set(), set(), {}
+    started = set()
+    pool = None
+
+    def should_skip(stage):
+        """Returns the reason to skip a stage, or None if it has to run."""
+        if stage.always:
+            return None
+        if stage.satisfied_by and stage.name not in force:
+            existing = [k for k in stage.satisfied_by if os.path.exists(paths[k])]
+            if existing:
+                return f"{os.path.basename(paths[existing[0]])} exists"
+        missing = [k for k in stage.inputs if not os.path.exists(paths[k])]
+        if missing:
+            if stage.outputs and all(os.path.exists(paths[k]) for k in stage.outputs):
+                return "inputs unavailable, reusing existing outputs"
+            if not (stage.fallback_inputs and all(os.path.exists(paths[k]) for k in stage.fallback_inputs)):
+                raise FileNotFoundError(f"missing inputs: {', '.join(paths[k] for k in missing)}")
+        fingerprint = stage_fingerprint(stage, paths)
+        record = manifest.get(stage.name, {})
+        if (stage.name not in force and record.get('fingerprint') == fingerprint
+                and all(os.path.exists(p) for p in record.get('outputs', []))):
+            return "up to date"
+        return None
+
+    def finish(stage):
+        manifest[stage.name] = {
+            'fingerprint': stage_fingerprint(stage, paths),
+            'outputs': [paths[k] for k in stage.outputs if os.path.exists(paths[k])],
+            'completed_at': time.time(),
+        }
+        save_manifest(paths['manifest'], manifest)
+        done.add(stage.name)
+
+    try:
+        while len(done) + len(failed) < len(stages):
+            for stage in stages:
+                if stage.name in started:
+                    continue
+                if any(d in failed for d in stage.deps):
+                    print(f"⏭️  {stage.name}: skipped (upstream failed)")
+                    started.add(stage.name)
+                    failed.add(stage.name)
+                    continue
+                if not all(d in done for d in stage.deps if d in by_name):
+                    continue
+                started.add(stage.name)
+                try:
+                    reason = should_skip(stage)
+                except FileNotFoundError as e:
+                    print(f"⚠️  {stage.name}: {e}")
+                    failed.add(stage.name)
+                    continue
+                if reason:
+                    print(f"✅ {stage.name}: {reason}, skipping.")
+                    done.add(stage.name)
+                    continue
+                print(f"▶️  {stage.name}: running...")
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                running[pool.submit(_run_stage, stage.name, stage.func, paths, stage.params)] = stage
+
+            if not running:
+                if len(started) == len(stages):
+                    break
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                try:
+                    future.result()
+                    finish(stage)
+                    print(f"✅ {stage.name}: done.")
+                except Exception as e:
+                    print(f"❌ {stage.name}: failed ({e!r})")
+                    failed.add(stage.name)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if trace_dir():
+            print(f"🧭 Trace written to {write_chrome_trace()}")
+    return done, failed
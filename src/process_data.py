@@ -1,24 +1,106 @@
+import numpy as np
 import pandas as pd
-from .config import map_alliance
+from .config import map_alliance_series
+from .profiling import span
+from .store import is_store, load_table, read_table
+from .numerals import NUMERIC_COLUMNS, VOTER_COLUMNS, parse_bengali_numbers, report_bad_counts
 
-def clean_and_process(file_path):
-    """Processes raw candidate data into a seat-level summary."""
-    df = pd.read_csv(file_path)
+SEAT_KEYS = ['Seat_ID', 'Seat_Name', 'Division']
+
+def clean_and_process(file_path, chunksize=None):
+    """Processes raw candidate data (CSV or columnar store) into a seat-level summary.
+
+    ``file_path`` may also be a list of files, which are merged in one pass.
+    With ``chunksize`` the input is streamed in bounded chunks and folded into
+    running seat x alliance totals, so memory stays flat however large the
+    archive is; the result is identical to the in-memory pivot.
+    """
+    paths = [file_path] if isinstance(file_path, (str, bytes)) or not hasattr(file_path, '__iter__') else list(file_path)
+    if chunksize:
+        return _clean_and_process_streaming(paths, chunksize)
+
+    with span("process:read", path=str(file_path)) as info:
+        frames = [read_table(p) for p in paths]
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        info['rows'] = len(df)
     
-    def bn_to_en(s):
-        """Converts Bengali numerals to English integers."""
-        if pd.isna(s) or s == '': return 0
-        translation = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
-        return int(str(s).replace(',', '').translate(translation))
-
-    df['Votes_Num'] = df['Votes'].apply(bn_to_en)
-    df['Alliance'] = df['Party'].apply(map_alliance)
-    pivot_df = df.pivot_table(
-        index=['Seat_ID', 'Seat_Name', 'Division'],
-        columns='Alliance',
-        values='Votes_Num',
-        aggfunc='sum',
-        fill_value=0
-    ).reset_index()
+    with span("process:parse_numbers", rows=len(df)):
+        numbers, _ = parse_bengali_numbers(df, NUMERIC_COLUMNS)
+    df['Votes_Num'] = numbers['Votes']
+    with span("process:map_alliance", rows=len(df)):
+        df['Alliance'] = map_alliance_series(df['Party'])
+    with span("process:pivot_table", rows=len(df)) as info:
+        pivot_df = df.pivot_table(
+            index=SEAT_KEYS,
+            columns='Alliance',
+            values='Votes_Num',
+            aggfunc='sum',
+            fill_value=0,
+            observed=True
+        ).reset_index()
+        info['output_rows'] = len(pivot_df)
+    pivot_df.columns = pivot_df.columns.astype(str)
+    pivot_df.columns.name = 'Alliance'
+
+    # Seat-level electorate figures for turnout and voter-roll analysis
+    voter_cols = [c for c in VOTER_COLUMNS if c in numbers.columns]
+    if voter_cols:
+        seat_voters = numbers[voter_cols].groupby(df['Seat_ID']).first()
+        pivot_df = pivot_df.merge(seat_voters, left_on='Seat_ID', right_index=True, how='left')
     
-    return pivot_df
\ No newline at end of file
+    return pivot_df
+
+def _iter_chunks(path, chunksize):
+    """Yields bounded row chunks from a CSV file or a memory-mapped store."""
+    if is_store(path):
+        table = load_table(path)
+        for start in range(0, len(table), chunksize):
+            yield table.iloc[start:start + chunksize].reset_index(drop=True)
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+def _clean_and_process_streaming(paths, chunksize):
+    """Chunked variant of clean_and_process; memory is bounded by seats x alliances."""
+    totals = None          # Votes summed by (seat keys, alliance)
+    voters = None          # First voter-roll figures seen per seat
+    dtypes = {}            # Widest parsed dtype per numeric column, to match a full pass
+    bad_counts = {}
+    rows = 0
+
+    with span("process:stream", paths=[str(p) for p in paths], chunksize=chunksize) as info:
+        for path in paths:
+            for chunk in _iter_chunks(path, chunksize):
+                rows += len(chunk)
+                numbers, bad = parse_bengali_numbers(chunk, NUMERIC_COLUMNS, report=False)
+                for col, count in bad.items():
+                    bad_counts[col] = bad_counts.get(col, 0) + count
+                for col in numbers.columns:
+                    dtypes[col] = np.promote_types(dtypes.get(col, numbers[col].dtype), numbers[col].dtype)
+
+                keys = chunk[SEAT_KEYS].copy()
+                keys['Alliance'] = map_alliance_series(chunk['Party']).astype(str)
+                chunk_totals = (numbers['Votes'].astype('int64')
+                                .groupby([keys[c] for c in keys.columns], observed=True, sort=False).sum())
+                totals = chunk_totals if totals is None else \
+                    pd.concat([totals, chunk_totals]).groupby(level=[0, 1, 2, 3], sort=False).sum()
+
+                voter_cols = [c for c in VOTER_COLUMNS if c in numbers.columns]
+                if voter_cols:
+                    chunk_voters = numbers[voter_cols].astype('int64').groupby(chunk['Seat_ID']).first()
+                    voters = chunk_voters if voters is None else \
+                        pd.concat([voters, chunk_voters]).groupby(level=0, sort=False).first()
+        info['rows'] = rows
+
+    report_bad_counts(bad_counts)
+    if totals is None:
+        return None
+
+    pivot_df = totals.unstack('Alliance', fill_value=0).sort_index().sort_index(axis=1)
+    pivot_df = pivot_df.astype(dtypes.get('Votes', np.int64)).reset_index()
+    pivot_df.columns = pivot_df.columns.astype(str)
+    pivot_df.columns.name = 'Alliance'
+
+    if voters is not None:
+        voters = voters.astype({c: dtypes[c] for c in voters.columns})
+        pivot_df = pivot_df.merge(voters, left_on='Seat_ID', right_index=True, how='left')
+    return pivot_df
@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Tracing is opt-in: set this to a directory (or call enable_tracing) to record spans.
+# Worker processes inherit it through the environment.
+TRACE_ENV = 'ELECTION_TRACE_DIR'
+# Id of the current run; spans carry it so trace.json only shows one run
+TRACE_RUN_ENV = 'ELECTION_TRACE_RUN'
+TRACE_FILE = 'trace.jsonl'
+CHROME_TRACE_FILE = 'trace.json'
+
+_write_lock = threading.Lock()
+# Highest resident set seen by each open span since it started (MB), keyed by span token
+_open_peaks = {}
+_peak_lock = threading.Lock()
+
+def enable_tracing(trace_dir):
+    """Turns on span recording for this process and any worker it starts, as a new run."""
+    os.makedirs(trace_dir, exist_ok=True)
+    os.environ[TRACE_ENV] = os.path.abspath(trace_dir)
+    start_trace_run()
+
+def start_trace_run():
+    """Starts a new run id; spans recorded from now on (here and in new workers) belong to it."""
+    os.environ[TRACE_RUN_ENV] = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{os.urandom(3).hex()}"
+    return os.environ[TRACE_RUN_ENV]
+
+def trace_dir():
+    return os.environ.get(TRACE_ENV)
+
+def trace_run():
+    return os.environ.get(TRACE_RUN_ENV)
+
+def _proc_status_mb(field):
+    """A memory field of /proc/self/status in MB (Linux), or None."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def _reset_peak_rss():
+    """Resets the kernel's high-water mark (VmHWM) to the current RSS; False if unsupported."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is in KB on Linux; it is the peak over the whole process lifetime
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _start_memory(token):
+    """Opens a span's memory window. Returns (rss at start, whether the peak can be reset)."""
+    with _peak_lock:
+        high = _proc_status_mb('VmHWM')
+        # Fold the peak so far into every open (enclosing or concurrent) span before resetting it
+        if high is not None:
+            for key, value in _open_peaks.items():
+                _open_peaks[key] = max(value, high)
+        rss = _proc_status_mb('VmRSS')
+        resettable = rss is not None and high is not None and _reset_peak_rss()
+        _open_peaks[token] = rss if resettable else 0.0
+        return (rss if resettable else _peak_rss_mb()), resettable
+
+def _end_memory(token, start_mb, resettable):
+    """Closes a span's memory window and returns (peak MB within the span, growth MB)."""
+    with _peak_lock:
+        seen = _open_peaks.pop(token, 0.0)
+        if resettable:
+            high = _proc_status_mb('VmHWM')
+            peak = max(seen, high if high is not None else 0.0)
+            return peak, peak - start_mb
+    # Without a resettable high-water mark only the lifetime peak is known
+    peak = _peak_rss_mb()
+    if peak is None or start_mb is None:
+        return peak, None
+    return peak, peak - start_mb
+
+@contextmanager
+def span(name, **meta):
+    """Records wall time, CPU time, peak RSS and row counts for a block of code.
+
+    ``peak_rss_mb`` is the highest resident set while the span was open: on
+    Linux the kernel's high-water mark is reset when a span starts (enclosing
+    spans keep their own maximum), so reused pool workers report each stage's
+    own peak. ``rss_growth_mb`` is that peak minus the RSS at the start.
+    Elsewhere the lifetime peak is reported and the growth is measured against it.
+
+    Yields a dict the caller may add fields to (e.g. ``info['rows'] = len(df)``).
+    Does nothing beyond yielding the dict when tracing is off.
+    """
+    info = dict(meta)
+    directory = trace_dir()
+    if not directory:
+        yield info
+        return
+
+    start_ts = time.time()
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    start_process_cpu = time.process_time()
+    token = object()
+    start_mb, resettable = _start_memory(token)
+    try:
+        yield info
+    except BaseException as e:
+        info['error'] = repr(e)
+        raise
+    finally:
+        peak_mb, growth_mb = _end_memory(token, start_mb, resettable)
+        record = {
+            'name': name,
+            'ts': start_ts,
+            'wall_s': time.perf_counter() - start_wall,
+            'cpu_s': time.thread_time() - start_cpu,
+            'process_cpu_s': time.process_time() - start_process_cpu,
+            'peak_rss_mb': peak_mb,
+            'rss_growth_mb': growth_mb,
+            'run': trace_run(),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            **info,
+        }
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        with _write_lock:
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, TRACE_FILE), 'a', encoding='utf-8') as f:
+                f.write(line)
+
+def load_trace(directory=None):
+    """Reads every recorded span from a trace directory."""
+    path = os.path.join(directory or trace_dir(), TRACE_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def write_chrome_trace(directory=None, run=None):
+    """Converts the JSON-lines spans of one run into a Chrome trace-format file (chrome://tracing, Perfetto).
+
+    ``run`` defaults to the current run; trace.jsonl keeps the spans of every run.
+    """
+    directory = directory or trace_dir()
+    run = run or trace_run()
+    events = []
+    for record in load_trace(directory):
+        if run is not None and record.get('run') != run:
+            continue
+        args = {k: v for k, v in record.items() if k not in ('name', 'ts', 'wall_s', 'pid', 'tid', 'run')}
+        events.append({
+            'name': record['name'],
+            'cat': record['name'].split(':')[0],
+            'ph': 'X',
+            'ts': record['ts'] * 1e6,
+            'dur': record['wall_s'] * 1e6,
+            'pid': record['pid'],
+            'tid': record['tid'],
+            'args': args,
+        })
+    path = os.path.join(directory, CHROME_TRACE_FILE)
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+    return path
@@ -0,0 +1,361 @@
+import argparse
+import json
+import os
+import threading
+import time
+import unicodedata
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+from urllib.parse import parse_qs, unquote, urlparse
+import numpy as np
+from .config import ALLIANCE_COLUMNS
+from .enrich import ensure_enriched
+from .numerals import VOTER_COLUMNS
+from .rollup import NATIONAL, RollupCube
+from .store import is_store, read_table
+
+DEFAULT_SEATS = os.path.join("data", "seat_wise_votes.csv")
+DEFAULT_DIVISIONS = os.path.join("data", "division_analysis.csv")
+CACHE_SIZE = 4096
+
+ASCII_TO_BENGALI = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+
+def normalize_name(name):
+    """Canonical seat-name key: NFKC, no spaces, plain hyphen, Bengali digits ("ঢাকা – 10" -> "ঢাকা-১০")."""
+    name = unicodedata.normalize("NFKC", str(name)).replace(" ", "").replace("–", "-")
+    return name.translate(ASCII_TO_BENGALI)
+
+def _file_stamp(path):
+    """Changes whenever a CSV or columnar store at ``path`` is rewritten."""
+    target = os.path.join(path, "meta.json") if is_store(path) else path
+    try:
+        st = os.stat(target)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _plain(value):
+    """Numpy scalars -> JSON-friendly Python values (NaN -> None)."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+def _freeze(value):
+    """Read-only copy of an answer: dicts -> MappingProxyType, lists -> tuples, recursively."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _json_default(value):
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+class ResultsIndex:
+    """Immutable, precomputed view of the seat and division results.
+
+    Every answer the service gives is built here once: seat records by ID and
+    normalized name, seat IDs per division and per winning alliance, seats
+    sorted by margin, and vote totals per division and alliance. Queries are
+    then dict lookups or slices, and results are memoized in an LRU cache that
+    lives and dies with the index. Answers are read-only (mappings and tuples),
+    so a caller cannot alter what later queries return.
+    """
+
+    def __init__(self, df_seats, df_divisions=None):
+        df_seats = ensure_enriched(df_seats)
+        alliances = [c for c in ALLIANCE_COLUMNS if c in df_seats.columns]
+        votes = df_seats[alliances].to_numpy(dtype=np.int64)
+        shares = df_seats[[f"{a}_Share" for a in alliances]].to_numpy(dtype=np.float64)
+        columns = ["Seat_ID", "Seat_Name", "Division", "Total_Votes", "Winner_Alliance",
+                   "Runner_Up_Alliance", "Margin", "Margin_Pct", "Turnout"]
+        extra = [c for c in VOTER_COLUMNS if c in df_seats.columns]
+
+        self.alliances = alliances
+        self.seats = {}
+        self.seat_ids_by_name = {}
+        self.seat_ids_by_division = {}
+        self.seat_ids_by_winner = {a: [] for a in alliances}
+        for i, row in enumerate(df_seats[[c for c in columns if c in df_seats.columns] + extra].itertuples(index=False)):
+            record = {k: _plain(v) for k, v in row._asdict().items()}
+            record["Seat_ID"] = seat_id = int(record["Seat_ID"])
+            record["Seat_Name"] = str(record["Seat_Name"])
+            record["Division"] = division = str(record["Division"])
+            record["Votes"] = {a: int(votes[i, j]) for j, a in enumerate(alliances)}
+            record["Share"] = {a: _plain(shares[i, j]) for j, a in enumerate(alliances)}
+            self.seats[seat_id] = record
+            self.seat_ids_by_name[normalize_name(record["Seat_Name"])] = seat_id
+            self.seat_ids_by_division.setdefault(division, []).append(seat_id)
+            if record["Winner_Alliance"] in self.seat_ids_by_winner:
+                self.seat_ids_by_winner[record["Winner_Alliance"]].append(seat_id)
+
+        # Closest races first, seats without votes left out; slicing gives top-N for any filter
+        margin_pct = df_seats["Margin_Pct"].to_numpy(dtype=np.float64)
+        by_margin = [i for i in np.argsort(margin_pct, kind="stable") if not np.isnan(margin_pct[i])]
+        self.seat_ids_by_margin = [int(df_seats["Seat_ID"].iat[i]) for i in by_margin]
+
+        # District, division and national aggregates come from the rollup cube
+        self.cube = RollupCube(df_seats, alliances)
+        self.division_totals = {d: self.cube.slice("division", d)["Votes"] for d in self.cube.keys("division")}
+        self.national_totals = self.cube.slice("national", NATIONAL)["Votes"]
+
+        self.divisions = {}
+        if df_divisions is not None:
+            for record in df_divisions.to_dict(orient="records"):
+                self.divisions[str(record["Division"])] = {k: _plain(v) for k, v in record.items()}
+
+        self._cached = lru_cache(maxsize=CACHE_SIZE)(self._answer)
+
+    # --- Query entry points (all memoized) ---
+
+    def query(self, kind, *args):
+        """Runs a query by name, e.g. ``query('seat', 12)`` or ``query('top_margins', 10, 'Sylhet')``."""
+        return self._cached(kind, *args)
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def _answer(self, kind, *args):
+        handler = getattr(self, f"_q_{kind}", None)
+        if handler is None:
+            raise KeyError(f"Unknown query: {kind}")
+        return _freeze(handler(*args))
+
+    def _q_seat(self, seat_id):
+        return self.seats.get(int(seat_id))
+
+    def _q_seat_by_name(self, name):
+        seat_id = self.seat_ids_by_name.get(normalize_name(name))
+        return None if seat_id is None else self.seats[seat_id]
+
+    def _q_division(self, division):
+        if division not in self.seat_ids_by_division:
+            return None
+        totals = self.division_totals[division]
+        total = sum(totals.values()) or 1
+        wins = {a: 0 for a in self.alliances}
+        for seat_id in self.seat_ids_by_division[division]:
+            winner = self.seats[seat_id]["Winner_Alliance"]
+            if winner in wins:
+                wins[winner] += 1
+        return {
+            "Division": division,
+            "Seats": len(self.seat_ids_by_division[division]),
+            "Seat_Wins": wins,
+            "Votes": totals,
+            "Share": {a: v / total * 100 for a, v in totals.items()},
+            "Analysis": self.divisions.get(division),
+        }
+
+    def _q_alliance(self, alliance, division=None):
+        """Vote total, share and seat wins of one alliance, nationally or within a division."""
+        if alliance not in self.alliances:
+            return None
+        if division is None:
+            totals, seat_ids = self.national_totals, self.seats.keys()
+        elif division in self.division_totals:
+            totals, seat_ids = self.division_totals[division], self.seat_ids_by_division[division]
+        else:
+            return None
+        total = sum(totals.values()) or 1
+        shares = [self.seats[s]["Share"][alliance] for s in seat_ids if self.seats[s]["Share"][alliance] is not None]
+        return {
+            "Alliance": alliance,
+            "Division": division,
+            "Votes": totals[alliance],
+            "Share": totals[alliance] / total * 100,
+            "Seat_Wins": sum(1 for s in seat_ids if self.seats[s]["Winner_Alliance"] == alliance),
+            "Mean_Seat_Share": float(np.mean(shares)) if shares else 0.0,
+        }
+
+    def _q_top_margins(self, n=10, division=None, alliance=None, widest=False):
+        """The ``n`` closest (or widest) races, optionally filtered by division and/or winner."""
+        ids = self.seat_ids_by_margin[::-1] if widest else self.seat_ids_by_margin
+        picked = []
+        for seat_id in ids:
+            seat = self.seats[seat_id]
+            if division is not None and seat["Division"] != division:
+                continue
+            if alliance is not None and seat["Winner_Alliance"] != alliance:
+                continue
+            picked.append(seat)
+            if len(picked) == n:
+                break
+        return picked
+
+    def _q_district(self, district):
+        district = unicodedata.normalize("NFKC", str(district)).strip()
+        if district not in self.cube.district_division:
+            return None
+        return {
+            "District": district,
+            "Division": self.cube.district_division[district],
+            "Seat_IDs": self.cube.children("district", district),
+            **self.cube.slice("district", district),
+        }
+
+    def _q_national(self):
+        total = sum(self.national_totals.values()) or 1
+        return {
+            "Seats": len(self.seats),
+            "Seat_Wins": {a: len(ids) for a, ids in self.seat_ids_by_winner.items()},
+            "Votes": self.national_totals,
+            "Share": {a: v / total * 100 for a, v in self.national_totals.items()},
+        }
+
+    def _q_json(self, kind, *args):
+        """Pre-serialized response body, so HTTP hits skip json.dumps as well."""
+        return json.dumps(self.query(kind, *args), ensure_ascii=False, default=_json_default).encode("utf-8")
+
+class QueryService:
+    """Loads the results once and answers queries from a hot-reloading ResultsIndex.
+
+    The data files are checked at most every ``check_interval`` seconds; when
+    one changed, a new index is built and swapped in with a single reference
+    assignment, so in-flight queries keep using the old one.
+    """
+
+    def __init__(self, seats_path=DEFAULT_SEATS, division_path=DEFAULT_DIVISIONS, check_interval=1.0):
+        self.seats_path = seats_path
+        self.division_path = division_path
+        self.check_interval = check_interval
+        self._reload_lock = threading.Lock()
+        self._stamps = None
+        self._next_check = 0.0
+        self.index = None
+        self.reload()
+
+    def _current_stamps(self):
+        return (_file_stamp(self.seats_path), _file_stamp(self.division_path))
+
+    def reload(self, force=True):
+        """Rebuilds the index if the data files changed (or always, with ``force``)."""
+        with self._reload_lock:
+            stamps = self._current_stamps()
+            if not force and stamps == self._stamps:
+                return False
+            df_seats = read_table(self.seats_path)
+            df_divisions = read_table(self.division_path) if stamps[1] is not None else None
+            self.index = ResultsIndex(df_seats, df_divisions)
+            self._stamps = stamps
+            return True
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        if self._current_stamps() != self._stamps:
+            try:
+                self.reload(force=False)
+            except Exception as e:
+                # Keep serving the last good index while a writer is mid-update
+                print(f"⚠️ Reload failed, keeping previous results: {e}")
+
+    def query(self, kind, *args):
+        self._maybe_reload()
+        return self.index.query(kind, *args)
+
+    def seat(self, seat_id):
+        return self.query("seat", int(seat_id))
+
+    def seat_by_name(self, name):
+        return self.query("seat_by_name", name)
+
+    def division(self, division):
+        return self.query("division", division)
+
+    def alliance(self, alliance, division=None):
+        return self.query("alliance", alliance, division)
+
+    def top_margins(self, n=10, division=None, alliance=None, widest=False):
+        return self.query("top_margins", int(n), division, alliance, bool(widest))
+
+    def national(self):
+        return self.query("national")
+
+def _route(path):
+    """Maps a request path to a (kind, args) query, or None."""
+    url = urlparse(path)
+    parts = [unquote(p) for p in url.path.strip("/").split("/") if p]
+    params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+    if parts == ["national"]:
+        return "national", ()
+    if len(parts) == 2 and parts[0] == "seat":
+        return ("seat", (int(parts[1]),)) if parts[1].isdigit() else ("seat_by_name", (parts[1],))
+    if len(parts) == 2 and parts[0] == "district":
+        return "district", (parts[1],)
+    if len(parts) == 2 and parts[0] == "division":
+        return "division", (parts[1],)
+    if len(parts) == 2 and parts[0] == "alliance":
+        return "alliance", (parts[1], params.get("division"))
+    if parts == ["margins"]:
+        return "top_margins", (int(params.get("n", 10)), params.get("division"), params.get("alliance"),
+                               params.get("widest", "0").lower() in ("1", "true", "yes"))
+    return None
+
+class _QueryServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections (1 s SYN retry) with dozens of clients
+    request_queue_size = 128
+
+def make_server(service, host="127.0.0.1", port=8770):
+    """Builds a threaded HTTP server exposing the query service as JSON.
+
+    Routes: ``/seat/{id or name}``, ``/district/{name}``, ``/division/{name}``, ``/alliance/{name}?division=``,
+    ``/margins?n=&division=&alliance=&widest=1`` and ``/national``.
+    """
+    class QueryHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            try:
+                route = _route(self.path)
+            except ValueError:
+                route = None
+            status, body = 404, b'{"error": "not found"}'
+            if route is not None:
+                kind, args = route
+                service._maybe_reload()
+                # One index per request: a reload in between must not mix two versions
+                index = service.index
+                if index.query(kind, *args) is not None:
+                    status, body = 200, index.query("json", kind, *args)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return _QueryServer((host, port), QueryHandler)
+
+def serve_in_background(service, **kwargs):
+    """Starts the query server on a daemon thread and returns (server, base_url)."""
+    server = make_server(service, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve seat and division results as a local JSON query API.")
+    parser.add_argument("--seats", default=DEFAULT_SEATS)
+    parser.add_argument("--divisions", default=DEFAULT_DIVISIONS)
+    parser.add_argument("--port", type=int, default=8770)
+    parser.add_argument("--check-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    service = QueryService(args.seats, args.divisions, check_interval=args.check_interval)
+    server = make_server(service, port=args.port)
+    print(f"🔎 Serving {len(service.index.seats)} seats on http://127.0.0.1:{args.port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
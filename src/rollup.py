@@ -0,0 +1,176 @@
+import re
+import unicodedata
+import numpy as np
+import pandas as pd
+from .config import ALLIANCE_COLUMNS
+from .enrich import ensure_enriched
+from .profiling import span
+
+LEVELS = ['seat', 'district', 'division', 'national']
+# Per-alliance metrics (units x alliances) and per-unit metrics (one value per unit)
+ALLIANCE_METRICS = ['Votes', 'Share', 'Seats_Won', 'Weighted']
+UNIT_METRICS = ['Total_Votes', 'Seats', 'Voter_Weight']
+NATIONAL = 'Bangladesh'
+
+_SEAT_NUMBER = re.compile(r'\s*[-–]\s*[০-৯0-9]+\s*$')
+
+def district_of(seat_names):
+    """Derives the district from seat names: "পঞ্চগড়-১" -> "পঞ্চগড়"; single-seat districts keep their name."""
+    names = pd.Series(seat_names, copy=False).astype(str).map(lambda s: unicodedata.normalize('NFKC', s))
+    return names.str.replace(_SEAT_NUMBER, '', regex=True).str.strip()
+
+def derive_metrics(votes, national_total):
+    """Share (%), Voter_Weight and Weighted impact for rows of alliance votes.
+
+    The single definition used by the cube, the weighted division analysis and
+    live snapshots: a unit's voter weight is its vote total over the national
+    total, and its weighted impact is share x voter weight.
+    """
+    totals = votes.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        share = votes / totals[:, None] * 100
+    voter_weight = totals / national_total if national_total else np.zeros(len(totals))
+    return {'Total_Votes': totals, 'Share': share, 'Voter_Weight': voter_weight,
+            'Weighted': share * voter_weight[:, None]}
+
+class RollupCube:
+    """Aggregate cube over (geography level x alliance x metric).
+
+    Seat votes and wins are summed bottom-up once (seat -> district ->
+    division -> national, each level from the one below), and shares, voter
+    weights and weighted impact are derived per level at build time. Every
+    slice is then an index lookup into a small array. Custom regions are built
+    by summing rows of an existing level, never by rescanning seats.
+    """
+
+    def __init__(self, df_seats, alliances=None):
+        df = ensure_enriched(df_seats)
+        self.alliances = [a for a in (alliances or ALLIANCE_COLUMNS) if a in df.columns]
+        self.alliance_pos = {a: j for j, a in enumerate(self.alliances)}
+        self.parents = {'seat': 'district', 'district': 'division', 'division': 'national'}
+        self._levels = {}
+
+        with span("rollup:build", rows=len(df)):
+            votes = df[self.alliances].to_numpy(dtype=np.int64)
+            winners = pd.Categorical(df['Winner_Alliance'], categories=self.alliances).codes
+            wins = np.zeros_like(votes)
+            won = winners >= 0
+            wins[np.flatnonzero(won), winners[won]] = 1
+            self._add_level('seat', df['Seat_ID'].astype(np.int64).tolist(), votes, wins, np.ones(len(df), dtype=np.int64))
+
+            # Seat -> district -> division, each grouping the level below
+            districts = district_of(df['Seat_Name'])
+            district_codes, district_keys = pd.factorize(districts, sort=True)
+            self._rollup('district', 'seat', district_codes, list(district_keys))
+            division_of_district = (pd.Series(df['Division'].astype(str).to_numpy())
+                                    .groupby(district_codes).first().to_numpy())
+            division_codes, division_keys = pd.factorize(division_of_district, sort=True)
+            self._rollup('division', 'district', division_codes, list(division_keys))
+            self._rollup('national', 'division', np.zeros(len(division_keys), dtype=np.int64), [NATIONAL])
+
+            self.district_division = dict(zip(district_keys, division_of_district))
+            self._derive_all()
+
+    # --- Building ---
+
+    def _add_level(self, level, keys, votes, wins, seats):
+        self._levels[level] = {
+            'keys': keys,
+            'index': {k: i for i, k in enumerate(keys)},
+            'Votes': votes,
+            'Seats_Won': wins,
+            'Seats': seats,
+        }
+
+    def _rollup(self, level, child, codes, keys):
+        """Sums the rows of ``child`` into ``len(keys)`` parent rows given each child's parent code."""
+        below = self._levels[child]
+        votes = np.zeros((len(keys), len(self.alliances)), dtype=np.int64)
+        wins = np.zeros_like(votes)
+        seats = np.zeros(len(keys), dtype=np.int64)
+        np.add.at(votes, codes, below['Votes'])
+        np.add.at(wins, codes, below['Seats_Won'])
+        np.add.at(seats, codes, below['Seats'])
+        self._add_level(level, keys, votes, wins, seats)
+        children = [[] for _ in keys]
+        for child_key, code in zip(below['keys'], codes):
+            children[code].append(child_key)
+        self._levels[level]['children'] = children
+
+    def _derive(self, level):
+        cells = self._levels[level]
+        cells.update(derive_metrics(cells['Votes'], self._levels['national']['Votes'].sum()))
+
+    def _derive_all(self):
+        for level in self._levels:
+            self._derive(level)
+
+    def add_regions(self, name, regions, from_level='district'):
+        """Registers a custom level, e.g. ``add_regions('zone', {'North': ['রংপুর', ...]})``.
+
+        ``regions`` maps each region to member keys of ``from_level``; rows of that
+        level are summed, so the seat table is not touched again. Members not
+        listed in any region are left out.
+        """
+        if name in self._levels:
+            raise ValueError(f"Level already exists: {name}")
+        below = self._levels[from_level]
+        keys = list(regions)
+        members, codes = [], []
+        for code, region in enumerate(keys):
+            for member in regions[region]:
+                if member not in below['index']:
+                    raise KeyError(f"Unknown {from_level}: {member!r}")
+                members.append(below['index'][member])
+                codes.append(code)
+        members, codes = np.asarray(members, dtype=np.int64), np.asarray(codes, dtype=np.int64)
+
+        votes = np.zeros((len(keys), len(self.alliances)), dtype=np.int64)
+        wins = np.zeros_like(votes)
+        seats = np.zeros(len(keys), dtype=np.int64)
+        np.add.at(votes, codes, below['Votes'][members])
+        np.add.at(wins, codes, below['Seats_Won'][members])
+        np.add.at(seats, codes, below['Seats'][members])
+        self._add_level(name, keys, votes, wins, seats)
+        self._derive(name)
+        return self
+
+    # --- Lookups ---
+
+    @property
+    def levels(self):
+        return list(self._levels)
+
+    def keys(self, level):
+        return list(self._levels[level]['keys'])
+
+    def value(self, level, key, metric, alliance=None):
+        """One cell, e.g. ``value('district', 'ঢাকা', 'Share', '11PA')`` or ``value('division', 'Dhaka', 'Voter_Weight')``."""
+        cells = self._levels[level]
+        i = cells['index'][key]
+        if metric in UNIT_METRICS:
+            return cells[metric][i].item()
+        return cells[metric][i, self.alliance_pos[alliance]].item()
+
+    def slice(self, level, key):
+        """Every metric for one unit: ``{metric: {alliance: value}}`` plus the per-unit metrics."""
+        cells = self._levels[level]
+        i = cells['index'][key]
+        out = {m: dict(zip(self.alliances, cells[m][i].tolist())) for m in ALLIANCE_METRICS}
+        out.update({m: cells[m][i].item() for m in UNIT_METRICS})
+        return out
+
+    def frame(self, level, metric):
+        """A level as a DataFrame: units x alliances, or a Series for per-unit metrics."""
+        cells = self._levels[level]
+        index = pd.Index(cells['keys'], name=level.capitalize())
+        if metric in UNIT_METRICS:
+            return pd.Series(cells[metric], index=index, name=metric)
+        return pd.DataFrame(cells[metric], index=index, columns=self.alliances)
+
+    def children(self, level, key):
+        """Keys of the units one level below that roll up into ``key`` (empty for seats and custom regions)."""
+        cells = self._levels[level]
+        if 'children' not in cells:
+            return []
+        return list(cells['children'][cells['index'][key]])
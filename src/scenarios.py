@@ -0,0 +1,109 @@
+import unicodedata
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from .config import ALLIANCE_COLUMNS, map_alliance
+from .numerals import parse_bengali_numbers
+from .store import read_table
+
+def _normalize(p):
+    return '' if pd.isna(p) else unicodedata.normalize('NFKC', str(p)).strip()
+
+class CoalitionModel:
+    """Evaluates many "what-if" party -> alliance mappings in one batched pass.
+
+    The raw candidate table is reduced once to a sparse seat x party vote
+    matrix ``V``. A scenario is a dict of ``{party keyword: alliance}``
+    overrides on top of the current ``map_alliance`` classification; each one
+    becomes a sparse party x alliance one-hot block, so ``V @ [M1 | M2 | ...]``
+    gives the seat x alliance votes of every scenario at once.
+    """
+
+    def __init__(self, raw, alliances=ALLIANCE_COLUMNS):
+        df = read_table(raw) if isinstance(raw, str) else raw
+        votes = parse_bengali_numbers(df, ['Votes'], report=False)[0]['Votes'].to_numpy(dtype=np.int64)
+        seat_codes, seat_ids = pd.factorize(df['Seat_ID'], sort=True)
+        party_codes, parties = pd.factorize(df['Party'].map(_normalize))
+
+        self.parties = list(parties)
+        self.V = sparse.csr_matrix((votes, (seat_codes, party_codes)),
+                                   shape=(len(seat_ids), len(self.parties)))
+        self.seats = (df.groupby(seat_codes)[['Seat_ID', 'Seat_Name', 'Division']].first()
+                        .reset_index(drop=True))
+        division_codes, self.divisions = pd.factorize(self.seats['Division'], sort=True)
+        self.D = sparse.csr_matrix((np.ones(len(self.seats)), (division_codes, np.arange(len(self.seats)))),
+                                   shape=(len(self.divisions), len(self.seats)))
+        self.baseline = [map_alliance(p) for p in self.parties]
+        self.alliances = list(alliances)
+        self._keyword_masks = {}
+
+    def _matches(self, keyword):
+        if keyword not in self._keyword_masks:
+            keyword_norm = _normalize(keyword)
+            self._keyword_masks[keyword] = np.array([keyword_norm in p for p in self.parties])
+        return self._keyword_masks[keyword]
+
+    def _labels(self, overrides):
+        labels = np.array(self.baseline, dtype=object)
+        for keyword, alliance in overrides.items():
+            labels[self._matches(keyword)] = alliance
+        return labels
+
+    def evaluate(self, scenarios, batch_size=1000):
+        """Returns winners, margins, seat counts and division totals for every scenario.
+
+        ``scenarios`` is a list of override dicts or a ``{name: overrides}`` dict.
+        Output arrays are indexed ``[scenario, seat]`` / ``[scenario, division, alliance]``
+        with alliance positions given by ``result['alliances']``; seats without
+        any votes get winner -1 and are left out of ``seat_counts``.
+        """
+        if isinstance(scenarios, dict):
+            names, scenarios = list(scenarios.keys()), list(scenarios.values())
+        else:
+            names = list(range(len(scenarios)))
+        label_sets = [self._labels(s) for s in scenarios]
+        alliances = self.alliances + sorted({a for labels in label_sets for a in labels} - set(self.alliances))
+        alliance_index = {a: i for i, a in enumerate(alliances)}
+        n_parties, n_alliances = len(self.parties), len(alliances)
+        n_seats = self.V.shape[0]
+
+        winners, margins, division_totals = [], [], []
+        for start in range(0, len(label_sets), batch_size):
+            batch = label_sets[start:start + batch_size]
+            k = len(batch)
+            cols = np.concatenate([[alliance_index[a] for a in labels] for labels in batch])
+            cols += np.repeat(np.arange(k) * n_alliances, n_parties)
+            M = sparse.csr_matrix((np.ones(k * n_parties, dtype=np.int64),
+                                   (np.tile(np.arange(n_parties), k), cols)),
+                                  shape=(n_parties, k * n_alliances))
+            seat_votes = (self.V @ M).toarray().reshape(n_seats, k, n_alliances).transpose(1, 0, 2)
+            top2 = np.partition(seat_votes, n_alliances - 2, axis=2)[:, :, -2:] if n_alliances > 1 else seat_votes
+            # Seats without any votes have no winner (-1), as in enrich_seats
+            winners.append(np.where(seat_votes.sum(axis=2) > 0, seat_votes.argmax(axis=2), -1))
+            margins.append(top2[:, :, -1] - top2[:, :, 0])
+            division_totals.append((self.D @ seat_votes.transpose(1, 0, 2).reshape(n_seats, -1))
+                                   .reshape(len(self.divisions), k, n_alliances).transpose(1, 0, 2))
+
+        winners = np.concatenate(winners)
+        scenario_rows = np.broadcast_to(np.arange(len(winners))[:, None], winners.shape)
+        decided = winners >= 0
+        seat_counts = np.bincount(scenario_rows[decided] * n_alliances + winners[decided],
+                                  minlength=len(winners) * n_alliances).reshape(-1, n_alliances)
+        return {
+            'scenarios': names,
+            'alliances': alliances,
+            'seats': self.seats,
+            'divisions': list(self.divisions),
+            'winners': winners,
+            'margins': np.concatenate(margins),
+            'seat_counts': pd.DataFrame(seat_counts, index=names, columns=alliances),
+            'division_totals': np.concatenate(division_totals),
+        }
+
+    def scenario_frame(self, result, i):
+        """Seat-level winner and margin table for the ``i``-th scenario of an ``evaluate`` result."""
+        df = result['seats'].copy()
+        labels = np.asarray(result['alliances'] + [None], dtype=object)  # index -1 -> None
+        df['Winner_Alliance'] = labels[result['winners'][i]]
+        df['Margin'] = result['margins'][i]
+        return df
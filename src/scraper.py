@@ -1,133 +1,490 @@
 import sys
 import subprocess
+import hashlib
+import json
+import threading
 import time
 import random
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
+from .numerals import parse_bengali_numbers
+from .profiling import span
+
+# Configuration
+BASE_URL = "https://election.somoynews.tv/seat/"
+TOTAL_SEATS = 300
+# Output path must match what main.py expects to avoid re-scraping
+OUTPUT_FILE = os.path.join("data", "raw_election_data.csv")
+# One JSON file per seat, written as soon as the seat is parsed
+CACHE_DIR = os.path.join("data", "cache", "seats")
+# "http": plain requests + lxml; "selenium": Chrome; "auto": HTTP, falling back to Chrome
+# for pages whose results only appear after JavaScript runs
+ENGINES = ("auto", "http", "selenium")
+HTTP_TIMEOUT = 15
+# Status labels exactly as in the committed raw CSV (য + nukta, not the precomposed য়)
+WINNER_STATUS = "বিজয়ী"
+LOSER_STATUS = "পরাজিত"
+# Written by earlier versions of the scraper
+_OLD_WINNER_STATUS = "বি বিজয়ী"
+STAT_LABELS = {"মোট ভোটার": "Total_Voters", "মোট কেন্দ্র": "Total_Centers",
+               "পুরুষ ভোটার": "Male_Voters", "নারী ভোটার": "Female_Voters"}
 
 def install(package):
     """Installs missing packages at runtime."""
     subprocess.check_call([sys.executable, "-m", "pip", "install", package])
 
-def run_scraper():
-    """Wrapped scraper function to collect raw election data."""
+def _ensure_selenium():
+    """Makes sure Selenium and the driver manager are importable."""
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
+        import selenium  # noqa: F401
+        import webdriver_manager  # noqa: F401
         print("✅ Libraries found!")
     except ImportError:
         print("⚠️ Libraries missing. Installing them now...")
         install("selenium")
         install("webdriver-manager")
         install("pandas")
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-
-    # Configuration
-    BASE_URL = "https://election.somoynews.tv/seat/"
-    TOTAL_SEATS = 300
-    # Output path must match what main.py expects to avoid re-scraping
-    OUTPUT_FILE = os.path.join("data", "raw_election_data.csv")
+
+def _new_driver(driver_path, headless):
+    """Starts one Chrome instance for a scraping worker."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
 
     options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized") 
-    # Uncomment next line for silent background scraping
-    # options.add_argument("--headless") 
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    else:
+        options.add_argument("--start-maximized")
+    return webdriver.Chrome(service=Service(driver_path), options=options)
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    all_data = []
+class RateLimiter:
+    """Spaces out page loads across all workers to a global requests/second budget."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+class EmptySeatPage(ValueError):
+    """The fetched HTML has no candidate cards (e.g. it is rendered client-side)."""
+
+def _new_session(pool_size=1):
+    """Creates a keep-alive HTTP session for one scraping worker."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # Retries are handled by run_scraper's backoff loop, not by urllib3
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "Mozilla/5.0 (election-analysis scraper)",
+                            "Accept": "text/html,application/xhtml+xml"})
+    return session
+
+def _has_class(*names):
+    """XPath predicate matching elements that carry every given CSS class."""
+    return " and ".join(f"contains(concat(' ', normalize-space(@class), ' '), ' {n} ')" for n in names)
+
+def _text(element):
+    """Visible text of an element with whitespace collapsed, like WebDriver's ``.text``."""
+    return " ".join(element.text_content().split())
+
+def parse_seat_html(html, seat_id):
+    """Parses a server-rendered seat page in one pass into the same rows as the Selenium parser."""
+    from lxml import html as lxml_html
+
+    tree = lxml_html.fromstring(html)
+
+    # 1. Seat Name
+    header = tree.xpath(f"//div[{_has_class('text-h5', 'px-0')}]")
+    seat_name = _text(header[0]).split(',')[0].strip() if header else f"Seat-{seat_id}"
+
+    # 2. Seat Statistics
+    stats = {"Total_Voters": "0", "Total_Centers": "0", "Male_Voters": "0", "Female_Voters": "0"}
+    for box in tree.xpath(f"//*[{_has_class('border-lightgray')}]"):
+        label = box.xpath(f".//*[{_has_class('text-subtitle-1')}]")
+        value = box.xpath(f".//*[{_has_class('text-green')} or {_has_class('text-title-1')}]")
+        if not label or not value:
+            continue
+        label = _text(label[0])
+        for key, column in STAT_LABELS.items():
+            if key in label:
+                stats[column] = _text(value[0])
+                break
+
+    # 3. Candidate Cards
+    rows = []
+    for card in tree.xpath(f"//*[{_has_class('my-4')}]"):
+        name = card.xpath(f".//*[{_has_class('text-subtitle-1-display')}]")
+        if not name:
+            continue
+        party = symbol = votes = "Unknown"
+        for p in card.iter("p"):
+            text = _text(p)
+            if "দল:" in text: party = text.replace("দল:", "").strip()
+            if "মার্কা:" in text: symbol = text.replace("মার্কা:", "").strip()
+            if "ভোট:" in text: votes = text.replace("ভোট:", "").strip()
+        rows.append({
+            "Seat_ID": seat_id, "Seat_Name": seat_name,
+            **stats, "Candidate": _text(name[0]), "Party": party,
+            "Symbol": symbol, "Votes": votes
+        })
+    if not rows:
+        raise EmptySeatPage(f"No candidate cards in the HTML for seat {seat_id}")
+    return rows
 
-    print(f"🚀 Starting Selenium Scrape for {TOTAL_SEATS} seats...")
+def scrape_seat_http(session, seat_id, base_url=BASE_URL, timeout=HTTP_TIMEOUT):
+    """Fetches one seat page over a pooled HTTP session and returns its candidate rows."""
+    with span("scraper:fetch", seat_id=seat_id, engine="http"):
+        response = session.get(f"{base_url}{seat_id}", timeout=timeout)
+        response.raise_for_status()
+    with span("scraper:parse", seat_id=seat_id, engine="http") as info:
+        rows = parse_seat_html(response.content, seat_id)
+        info['rows'] = len(rows)
+    return rows
 
+def scrape_seat(driver, seat_id, base_url=BASE_URL):
+    """Loads one seat page and returns its candidate rows."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    with span("scraper:fetch", seat_id=seat_id):
+        driver.get(f"{base_url}{seat_id}")
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "text-subtitle-1-display"))
+        )
+    with span("scraper:parse", seat_id=seat_id) as info:
+        rows = _parse_seat_page(driver, seat_id)
+        info['rows'] = len(rows)
+    return rows
+
+def _parse_seat_page(driver, seat_id):
+    """Extracts the seat name, statistics and candidate cards from a loaded page."""
+    from selenium.webdriver.common.by import By
+
+    # 1. Extract Seat Name
     try:
-        for seat_id in range(1, TOTAL_SEATS + 1):
-            url = f"{BASE_URL}{seat_id}"
-            print(f"Opening Seat {seat_id}...", end=" ", flush=True)
-            
-            try:
-                driver.get(url)
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "text-subtitle-1-display"))
-                )
+        header_element = driver.find_element(By.CSS_SELECTOR, "div.text-h5.px-0")
+        full_text = header_element.text
+        seat_name = full_text.split(',')[0].strip()
+    except:
+        seat_name = f"Seat-{seat_id}"
 
-                # 1. Extract Seat Name
-                try:
-                    header_element = driver.find_element(By.CSS_SELECTOR, "div.text-h5.px-0")
-                    full_text = header_element.text
-                    seat_name = full_text.split(',')[0].strip()
-                except:
-                    seat_name = f"Seat-{seat_id}"
-
-                # 2. Extract Seat Statistics
-                stats = {"Total_Voters": "0", "Total_Centers": "0", "Male_Voters": "0", "Female_Voters": "0"}
-                stat_boxes = driver.find_elements(By.CLASS_NAME, "border-lightgray")
-                for box in stat_boxes:
-                    try:
-                        label = box.find_element(By.CLASS_NAME, "text-subtitle-1").text.strip()
-                        value = box.find_element(By.CSS_SELECTOR, ".text-green, .text-title-1").text.strip()
-                        if "মোট ভোটার" in label: stats["Total_Voters"] = value
-                        elif "মোট কেন্দ্র" in label: stats["Total_Centers"] = value
-                        elif "পুরুষ ভোটার" in label: stats["Male_Voters"] = value
-                        elif "নারী ভোটার" in label: stats["Female_Voters"] = value
-                    except: continue
-
-                # 3. Extract Candidate Cards
-                cards = driver.find_elements(By.CLASS_NAME, "my-4")
-                for card in cards:
+    # 2. Extract Seat Statistics
+    stats = {"Total_Voters": "0", "Total_Centers": "0", "Male_Voters": "0", "Female_Voters": "0"}
+    stat_boxes = driver.find_elements(By.CLASS_NAME, "border-lightgray")
+    for box in stat_boxes:
+        try:
+            label = box.find_element(By.CLASS_NAME, "text-subtitle-1").text.strip()
+            value = box.find_element(By.CSS_SELECTOR, ".text-green, .text-title-1").text.strip()
+            if "মোট ভোটার" in label: stats["Total_Voters"] = value
+            elif "মোট কেন্দ্র" in label: stats["Total_Centers"] = value
+            elif "পুরুষ ভোটার" in label: stats["Male_Voters"] = value
+            elif "নারী ভোটার" in label: stats["Female_Voters"] = value
+        except: continue
+
+    # 3. Extract Candidate Cards
+    rows = []
+    cards = driver.find_elements(By.CLASS_NAME, "my-4")
+    for card in cards:
+        try:
+            name = card.find_element(By.CLASS_NAME, "text-subtitle-1-display").text.strip()
+            p_tags = card.find_elements(By.TAG_NAME, "p")
+            party = symbol = votes = "Unknown"
+            for p in p_tags:
+                text = p.text
+                if "দল:" in text: party = text.replace("দল:", "").strip()
+                if "মার্কা:" in text: symbol = text.replace("মার্কা:", "").strip()
+                if "ভোট:" in text: votes = text.replace("ভোট:", "").replace("\n", "").strip()
+
+            rows.append({
+                "Seat_ID": seat_id, "Seat_Name": seat_name,
+                **stats, "Candidate": name, "Party": party,
+                "Symbol": symbol, "Votes": votes
+            })
+        except: continue
+    return rows
+
+def cache_dir_for(output_file):
+    """Per-output seat cache: ``data/raw_election_data.csv`` -> ``data/cache/seats``,
+    ``data/raw_election_data_local.csv`` -> ``data/cache/seats_raw_election_data_local``.
+
+    Keeping caches apart stops rows fetched for one output (e.g. the local
+    fixture server) from being treated as fresh for another.
+    """
+    stem = os.path.splitext(os.path.basename(output_file))[0]
+    default_stem = os.path.splitext(os.path.basename(OUTPUT_FILE))[0]
+    name = "seats" if stem == default_stem else f"seats_{stem}"
+    return os.path.join(os.path.dirname(output_file) or ".", "cache", name)
+
+def capture_seat_page(seat_id, directory, base_url=BASE_URL, browser=True):
+    """Saves a seat page's raw HTML as ``seat_<id>.html`` for offline parser tests.
+
+    With ``browser`` (and Selenium available) the page is also loaded in Chrome
+    and the Selenium parser's rows are saved as ``seat_<id>.json``, the expected
+    output tests compare ``parse_seat_html`` against.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with _new_session() as session:
+        response = session.get(f"{base_url}{seat_id}", timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+    with open(os.path.join(directory, f"seat_{seat_id}.html"), "wb") as f:
+        f.write(response.content)
+    if not browser:
+        return None
+    _ensure_selenium()
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver = _new_driver(ChromeDriverManager().install(), headless=True)
+    try:
+        rows = scrape_seat(driver, seat_id, base_url)
+    finally:
+        driver.quit()
+    with open(os.path.join(directory, f"seat_{seat_id}.json"), "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False, indent=1)
+    return rows
+
+def _cache_path(cache_dir, seat_id):
+    return os.path.join(cache_dir, f"{seat_id}.json")
+
+def load_seat_cache(cache_dir, seat_id):
+    """Returns the cached entry for a seat, or None if it was never fetched."""
+    try:
+        with open(_cache_path(cache_dir, seat_id), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_seat_cache(cache_dir, seat_id, rows=None, error=None):
+    """Persists one seat's rows (or its failure) atomically and returns the entry."""
+    entry = {
+        "seat_id": seat_id,
+        "status": "failed" if error is not None else "ok",
+        "fetched_at": time.time(),
+        "content_hash": hashlib.sha256(
+            json.dumps(rows or [], ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest(),
+        "error": error,
+        "rows": rows or [],
+    }
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _cache_path(cache_dir, seat_id)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return entry
+
+def seats_to_fetch(seat_ids, cache_dir, max_age_hours=None):
+    """Picks the seats whose cache entry is missing, failed or older than ``max_age_hours``."""
+    now = time.time()
+    pending = []
+    for seat_id in seat_ids:
+        entry = load_seat_cache(cache_dir, seat_id)
+        if entry is None or entry.get("status") != "ok":
+            pending.append(seat_id)
+        elif max_age_hours is not None and now - entry.get("fetched_at", 0) > max_age_hours * 3600:
+            pending.append(seat_id)
+    return pending
+
+def merge_cache_into_csv(cache_dir, output_file):
+    """Writes every successfully cached seat into the raw CSV, in seat order.
+
+    Only the rows of seats with an ``ok`` cache entry are replaced; every other
+    seat already in ``output_file`` is kept as it is, so a partial refresh or a
+    run where some seats fail never drops data. Division names are not on the
+    seat pages, so any already filled in by hand are carried over by Seat_ID.
+    """
+    if not os.path.isdir(cache_dir):
+        return None
+    seat_ids = [int(name[:-5]) for name in os.listdir(cache_dir)
+                if name.endswith(".json") and name[:-5].isdigit()]
+    all_data = []
+    for seat_id in sorted(seat_ids):
+        entry = load_seat_cache(cache_dir, seat_id)
+        if entry is not None and entry.get("status") == "ok":
+            all_data.extend(entry["rows"])
+    if not all_data:
+        return None
+
+    df = build_raw_frame(all_data)
+    if os.path.exists(output_file):
+        previous = pd.read_csv(output_file, encoding="utf-8-sig")
+        if "Division" in previous.columns:
+            divisions = previous[["Seat_ID", "Division"]].dropna().drop_duplicates("Seat_ID").set_index("Seat_ID")["Division"]
+            df["Division"] = df["Seat_ID"].map(divisions)
+        kept = previous[~previous["Seat_ID"].isin(df["Seat_ID"])]
+        if "Status" in kept.columns:
+            kept = kept.assign(Status=kept["Status"].replace(_OLD_WINNER_STATUS, WINNER_STATUS))
+        df = pd.concat([kept, df], ignore_index=True)
+        df = df.sort_values("Seat_ID", kind="stable", ignore_index=True)
+
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    return df
+
+def build_raw_frame(all_data):
+    """Turns scraped candidate rows into the raw election table with winners marked."""
+    df = pd.DataFrame(all_data)
+
+    # Translate Bengali numerals to Integers for calculation
+    df['Votes_Numeric'] = parse_bengali_numbers(df, ['Votes'], report=False)[0]['Votes']
+    # Identify winner based on highest vote count per seat
+    winner_indices = df.groupby('Seat_ID')['Votes_Numeric'].idxmax()
+    df['Status'] = LOSER_STATUS
+    df.loc[winner_indices, 'Status'] = WINNER_STATUS
+    return df.drop(columns=['Votes_Numeric'])
+
+def run_scraper(workers=1, headless=None, rate_limit=1.2, max_retries=2, backoff=1.0,
+                base_url=BASE_URL, seat_ids=None, output_file=OUTPUT_FILE,
+                cache_dir=None, max_age_hours=None, resume=True, engine="auto"):
+    """Wrapped scraper function to collect raw election data.
+
+    With ``engine="http"`` each worker fetches seat pages over its own
+    keep-alive ``requests`` session and parses them with lxml; ``"selenium"``
+    drives ``workers`` Chrome instances (headless by default when more than
+    one worker is used). ``"auto"`` uses HTTP until a seat's HTML carries no
+    candidate cards, then switches to Chrome for the rest of the run. ``rate_limit`` caps page loads
+    per second across all workers, and a seat that fails to load is retried up
+    to ``max_retries`` times with exponential backoff before it is given up on.
+
+    Every seat is written to ``cache_dir`` (by default derived from
+    ``output_file``, see ``cache_dir_for``) as soon as it is parsed. With
+    ``resume`` on, only seats that are missing, failed or older than
+    ``max_age_hours`` are fetched again before the cache is merged into
+    ``output_file``.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    if cache_dir is None:
+        cache_dir = cache_dir_for(output_file)
+    if seat_ids is None:
+        seat_ids = range(1, TOTAL_SEATS + 1)
+    all_seats = list(seat_ids)
+    seat_ids = seats_to_fetch(all_seats, cache_dir, max_age_hours) if resume else all_seats
+    if not seat_ids:
+        print(f"✅ All {len(all_seats)} seats are cached and fresh. Nothing to fetch.")
+        merge_cache_into_csv(cache_dir, output_file)
+        return
+
+    if headless is None:
+        headless = workers > 1
+
+    limiter = RateLimiter(rate_limit)
+    local = threading.local()
+    drivers, sessions = [], []
+    resources_lock = threading.Lock()
+    driver_path = []
+
+    def get_session():
+        if getattr(local, "session", None) is None:
+            local.session = _new_session()
+            with resources_lock:
+                sessions.append(local.session)
+        return local.session
+
+    def get_driver():
+        if getattr(local, "driver", None) is None:
+            with resources_lock:
+                # Selenium and the driver binary are only set up once a seat needs a browser
+                if not driver_path:
+                    _ensure_selenium()
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    driver_path.append(ChromeDriverManager().install())
+            local.driver = _new_driver(driver_path[0], headless)
+            with resources_lock:
+                drivers.append(local.driver)
+        return local.driver
+
+    def reset_driver():
+        driver = getattr(local, "driver", None)
+        local.driver = None
+        if driver is not None:
+            with resources_lock:
+                drivers.remove(driver)
+            try: driver.quit()
+            except: pass
+
+    # In auto mode the first page without server-rendered results switches the whole run to Chrome
+    browser_only = threading.Event()
+    if engine == "selenium":
+        browser_only.set()
+
+    def fetch(seat_id):
+        for attempt in range(max_retries + 1):
+            use_browser = browser_only.is_set()
+            limiter.wait()
+            try:
+                if not use_browser:
                     try:
-                        name = card.find_element(By.CLASS_NAME, "text-subtitle-1-display").text.strip()
-                        p_tags = card.find_elements(By.TAG_NAME, "p")
-                        party = symbol = votes = "Unknown"
-                        for p in p_tags:
-                            text = p.text
-                            if "দল:" in text: party = text.replace("দল:", "").strip()
-                            if "মার্কা:" in text: symbol = text.replace("মার্কা:", "").strip()
-                            if "ভোট:" in text: votes = text.replace("ভোট:", "").replace("\n", "").strip()
-
-                        all_data.append({
-                            "Seat_ID": seat_id, "Seat_Name": seat_name,
-                            **stats, "Candidate": name, "Party": party,
-                            "Symbol": symbol, "Votes": votes
-                        })
-                    except: continue
-                print(f"✅ {seat_id}: Success.")
+                        return scrape_seat_http(get_session(), seat_id, base_url)
+                    except EmptySeatPage:
+                        if engine != "auto":
+                            raise
+                        # Results are rendered client-side: let Chrome run this and every later page
+                        if not browser_only.is_set():
+                            browser_only.set()
+                            print("🧭 Seat pages are rendered client-side; switching to Chrome for the rest of the run.")
+                        use_browser = True
+                        limiter.wait()
+                return scrape_seat(get_driver(), seat_id, base_url)
             except Exception:
-                print(f"⚠️  Skipping Seat {seat_id} (Loading issue)")
-            
-            time.sleep(random.uniform(0.5, 1.2))
+                if attempt == max_retries:
+                    raise
+                # A dead or wedged browser is the usual cause, so start a fresh one
+                if use_browser:
+                    reset_driver()
+                time.sleep(backoff * 2 ** attempt + random.uniform(0, backoff))
+
+    fetched = changed = 0
+    failed = []
+    label = "Selenium" if browser_only.is_set() else "HTTP"
+    print(f"🚀 Starting {label} Scrape for {len(seat_ids)} of {len(all_seats)} seats with {workers} worker(s)...")
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(fetch, seat_id): seat_id for seat_id in seat_ids}
+            for future in as_completed(futures):
+                seat_id = futures[future]
+                previous = load_seat_cache(cache_dir, seat_id)
+                try:
+                    entry = save_seat_cache(cache_dir, seat_id, future.result())
+                    fetched += 1
+                    if previous is None or previous.get("content_hash") != entry["content_hash"]:
+                        changed += 1
+                    print(f"✅ {seat_id}: Success.")
+                except Exception as e:
+                    failed.append(seat_id)
+                    # Never overwrite good cached rows with a failure marker
+                    if previous is None or previous.get("status") != "ok":
+                        save_seat_cache(cache_dir, seat_id, error=repr(e))
+                    print(f"⚠️  Skipping Seat {seat_id} (Loading issue after {max_retries + 1} attempts)")
 
     finally:
-        driver.quit()
-        if all_data:
-            df = pd.DataFrame(all_data)
-            
-            # Translate Bengali numerals to Integers for calculation
-            def bangla_to_int(s):
-                if pd.isna(s): return 0
-                s = str(s).replace(',', '')
-                translation = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
-                try: return int(s.translate(translation))
-                except: return 0
-
-            df['Votes_Numeric'] = df['Votes'].apply(bangla_to_int)
-            # Identify winner based on highest vote count per seat
-            winner_indices = df.groupby('Seat_ID')['Votes_Numeric'].idxmax()
-            df['Status'] = 'পরাজিত' 
-            df.loc[winner_indices, 'Status'] = 'বি বিজয়ী'
-            df = df.drop(columns=['Votes_Numeric'])
-
-            # Ensure 'data' directory exists
-            os.makedirs("data", exist_ok=True)
-            df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
-            print(f"\n🎉 SUCCESS! Saved {len(df)} rows to {OUTPUT_FILE}")
+        for driver in drivers:
+            try: driver.quit()
+            except: pass
+        for session in sessions:
+            session.close()
+        df = merge_cache_into_csv(cache_dir, output_file)
+        if df is not None:
+            print(f"\n🎉 SUCCESS! Fetched {fetched} seats ({changed} changed). Saved {len(df)} rows to {output_file}")
+        if failed:
+            print(f"⚠️  {len(failed)} seat(s) failed: {sorted(failed)}")
 
 if __name__ == "__main__":
-    run_scraper()
\ No newline at end of file
+    run_scraper()
@@ -0,0 +1,147 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from .config import ALLIANCE_COLUMNS
+
+def build_share_matrix(df_seats, alliances=None):
+    """Turns the seat-level alliance vote table into a seats x alliances vote-share matrix.
+
+    Returns ``(shares, alliances, division_codes, divisions)`` where
+    ``division_codes[i]`` indexes ``divisions`` for seat ``i``. Seats without a
+    division are rejected, since their regional swing would be undefined.
+    """
+    alliances = [a for a in (alliances or ALLIANCE_COLUMNS) if a in df_seats.columns]
+    votes = df_seats[alliances].to_numpy(dtype=np.float64)
+    totals = votes.sum(axis=1, keepdims=True)
+    shares = np.divide(votes, totals, out=np.zeros_like(votes), where=totals > 0)
+    division_codes, divisions = pd.factorize(df_seats['Division'], sort=True)
+    if (division_codes < 0).any():
+        missing = df_seats['Seat_ID'].to_numpy()[division_codes < 0].tolist()
+        raise ValueError(f"Seats without a Division: {missing}")
+    return shares, alliances, division_codes, list(divisions)
+
+def _simulate_chunk(seed, c, base, contenders, seat_division, n_alliances, n_divisions,
+                    national_sd, division_sd, seat_sd, majority, tipping):
+    """Runs ``c`` draws and returns (seat histogram, majority hits, tipping-seat hits)."""
+    rng = np.random.default_rng(seed)
+    top_k, n_seats = base.shape
+    national = rng.standard_normal((c, n_alliances), dtype=np.float32) * np.float32(national_sd)
+    regional = rng.standard_normal((c, n_divisions * n_alliances), dtype=np.float32) * np.float32(division_sd)
+    # Contender-major layout: sim[j] is the (draws, seats) share of each seat's j-th contender
+    sim = rng.standard_normal((top_k, c, n_seats), dtype=np.float32) * np.float32(seat_sd)
+    regional_idx = seat_division * n_alliances + contenders
+    for j in range(top_k):
+        sim[j] += base[j]
+        sim[j] += national[:, contenders[j]]
+        sim[j] += regional[:, regional_idx[j]]
+
+    best = sim[0].copy()
+    winners = np.broadcast_to(contenders[0], (c, n_seats)).copy()
+    for j in range(1, top_k):
+        better = sim[j] > best
+        np.copyto(best, sim[j], where=better)
+        np.copyto(winners, np.broadcast_to(contenders[j], (c, n_seats)), where=better)
+
+    counts = np.bincount((np.arange(c)[:, None] * n_alliances + winners).ravel(),
+                         minlength=c * n_alliances).reshape(c, n_alliances)
+    seat_hist = np.stack([np.bincount(counts[:, a], minlength=n_seats + 1) for a in range(n_alliances)])
+    has_majority = counts >= majority
+
+    tipping_hits = np.zeros((n_alliances, n_seats), dtype=np.int64)
+    if tipping and majority <= n_seats:
+        neg_inf = np.float32(-np.inf)
+        for a in np.unique(contenders):
+            rows = np.flatnonzero(has_majority[:, a])
+            if rows.size == 0:
+                continue
+            own = np.full((rows.size, n_seats), neg_inf, dtype=np.float32)
+            rival = own.copy()
+            for j in range(top_k):
+                is_a = contenders[j] == a
+                share = sim[j][rows]
+                np.maximum(own, np.where(is_a, share, neg_inf), out=own)
+                np.maximum(rival, np.where(is_a, neg_inf, share), out=rival)
+            margin = own - rival
+            # The tipping seat is the one with the majority-th largest margin
+            tip = np.argpartition(-margin, majority - 1, axis=1)[:, majority - 1]
+            tipping_hits[a] = np.bincount(tip, minlength=n_seats)
+    return seat_hist, has_majority.sum(axis=0), tipping_hits
+
+def simulate_seats(df_seats, draws=100_000, national_sd=0.03, division_sd=0.02, seat_sd=0.03,
+                   top_k=3, chunk_size=5_000, seed=None, majority=None, tipping_draws=100_000,
+                   workers=None):
+    """Monte Carlo seat outcomes under random national, division and seat-level swings.
+
+    Every draw adds a normal swing (in vote-share points) per alliance
+    nationally, per alliance within each division and per contender within each
+    seat, then awards each seat to the highest share. Only each seat's ``top_k``
+    alliances are simulated, since the rest cannot realistically win.
+
+    Draws are processed ``chunk_size`` at a time across ``workers`` threads, so
+    memory stays bounded. Every chunk gets its own child seed of ``seed``, which
+    makes results reproducible regardless of the number of workers. Tipping
+    points are estimated from the first ``tipping_draws`` draws.
+
+    Seats without any votes are left undecided: they are not simulated, never
+    won, and not candidates for the tipping point, though the majority is
+    still counted over all seats.
+
+    Returns a dict with ``seat_distribution`` (P(alliance wins exactly n seats)),
+    ``expected_seats``, ``majority_probability``, ``tipping_points`` (how often
+    each seat was the one that delivered an alliance its majority, among the
+    tipping sample) and ``undecided_seats``.
+    """
+    shares, alliances, division_codes, divisions = build_share_matrix(df_seats)
+    majority = majority or len(shares) // 2 + 1
+    decided = shares.sum(axis=1) > 0
+    undecided_seats = df_seats['Seat_ID'].to_numpy()[~decided].tolist()
+    shares, division_codes = shares[decided], division_codes[decided]
+    seat_ids = df_seats['Seat_ID'].to_numpy()[decided]
+    seat_names = df_seats['Seat_Name'].to_numpy()[decided]
+    n_seats, n_alliances = shares.shape
+    top_k = min(top_k, n_alliances)
+
+    # Each seat's strongest contenders, and their baseline shares (contender-major)
+    contenders = np.ascontiguousarray(np.argsort(-shares, axis=1, kind='stable')[:, :top_k].T)
+    base = np.take_along_axis(shares.T, contenders, axis=0).astype(np.float32)
+
+    starts = range(0, draws, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    args = [
+        (chunk_seed, min(chunk_size, draws - start), base, contenders, division_codes,
+         n_alliances, len(divisions), national_sd, division_sd, seat_sd, majority,
+         start < tipping_draws)
+        for chunk_seed, start in zip(seeds, starts)
+    ]
+    # NumPy releases the GIL in the heavy kernels, so threads scale across cores
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = list(pool.map(lambda a: _simulate_chunk(*a), args))
+
+    seat_hist = sum(r[0] for r in results)
+    majority_hits = sum(r[1] for r in results)
+    tipping_hits = sum(r[2] for r in results)
+    tipping_total = min(draws, -(-tipping_draws // chunk_size) * chunk_size)
+
+    seat_distribution = pd.DataFrame(seat_hist.T / draws, columns=alliances)
+    seat_distribution.index.name = 'Seats'
+    expected_seats = pd.Series(seat_distribution.to_numpy().T @ np.arange(n_seats + 1),
+                               index=alliances, name='Expected_Seats')
+    majority_probability = pd.Series(majority_hits / draws, index=alliances, name='Majority_Probability')
+
+    a_idx, s_idx = np.nonzero(tipping_hits)
+    tipping_points = pd.DataFrame({
+        'Alliance': np.array(alliances)[a_idx],
+        'Seat_ID': seat_ids[s_idx],
+        'Seat_Name': seat_names[s_idx],
+        'Probability': tipping_hits[a_idx, s_idx] / tipping_total,
+    }).sort_values(['Alliance', 'Probability'], ascending=[True, False], ignore_index=True)
+
+    return {
+        'draws': draws,
+        'seat_distribution': seat_distribution,
+        'expected_seats': expected_seats,
+        'majority_probability': majority_probability,
+        'tipping_points': tipping_points,
+        'undecided_seats': undecided_seats,
+    }
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import numpy as np
+import pandas as pd
+
+# Tables are saved as a directory: meta.json plus a version directory with one .npy file per column
+STORE_SUFFIX = '.cols'
+FORMAT_VERSION = 2
+
+def is_store(path):
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, 'meta.json'))
+
+def _smallest_int(values):
+    """Downcasts an integer array to the narrowest dtype that holds it."""
+    if values.size == 0:
+        return values.astype(np.int8)
+    return pd.to_numeric(pd.Series(values, copy=False), downcast='integer').to_numpy()
+
+def _is_text(series):
+    return (isinstance(series.dtype, pd.CategoricalDtype)
+            or pd.api.types.is_string_dtype(series.dtype)
+            or pd.api.types.is_object_dtype(series.dtype))
+
+def save_table(df, path):
+    """Writes a DataFrame as a typed columnar store.
+
+    Text columns are dictionary-encoded (categories in meta.json, codes in the
+    narrowest integer dtype) and integer columns are downcast. Column files go
+    into a new version directory named after their content, then meta.json
+    (which points at it) is replaced atomically: readers see either the old or
+    the new table, never a missing or half-written one. The previous version is
+    kept until the next save so readers that just read the old meta.json can
+    still load it.
+    """
+    os.makedirs(path, exist_ok=True)
+    tmp_path = os.path.join(path, f".tmp-{os.getpid()}-{threading.get_ident()}")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    meta = {'version': FORMAT_VERSION, 'nrows': len(df), 'columns': []}
+    digest = hashlib.sha256()
+    for i, name in enumerate(df.columns):
+        series = df[name]
+        entry = {'name': str(name), 'file': f"{i}.npy"}
+        if _is_text(series):
+            categorical = pd.Categorical(series)
+            entry['kind'] = 'category'
+            entry['categories'] = categorical.categories.tolist()
+            entry['ordered'] = bool(categorical.ordered)
+            values = _smallest_int(categorical.codes.astype(np.int64))
+        elif pd.api.types.is_integer_dtype(series.dtype) and not isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            entry['kind'] = 'numeric'
+            values = _smallest_int(series.to_numpy())
+        else:
+            entry['kind'] = 'numeric'
+            values = series.to_numpy()
+        entry['dtype'] = values.dtype.str
+        values = np.ascontiguousarray(values)
+        np.save(os.path.join(tmp_path, entry['file']), values, allow_pickle=False)
+        digest.update(values.tobytes())
+        meta['columns'].append(entry)
+
+    # Same content -> same directory, so rewriting an unchanged table changes nothing
+    digest.update(json.dumps(meta, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    meta['dir'] = f"v-{digest.hexdigest()[:16]}"
+    version_path = os.path.join(path, meta['dir'])
+    if os.path.isdir(version_path):
+        shutil.rmtree(tmp_path)
+    else:
+        os.replace(tmp_path, version_path)
+
+    previous = _read_meta(path).get('dir') if os.path.exists(os.path.join(path, 'meta.json')) else None
+    meta_tmp = os.path.join(path, f"meta.json.{os.getpid()}.tmp")
+    with open(meta_tmp, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(meta_tmp, os.path.join(path, 'meta.json'))
+
+    # Drop everything but the live and the previous version (and older flat layouts)
+    for name in os.listdir(path):
+        if name in ('meta.json', meta['dir'], previous) or name.startswith('.tmp-') or name.endswith('.tmp'):
+            continue
+        target = os.path.join(path, name)
+        if os.path.isdir(target):
+            shutil.rmtree(target, ignore_errors=True)
+        else:
+            os.remove(target)
+
+def _read_meta(path):
+    with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+def content_files(path):
+    """Files whose bytes identify a store's current contents.
+
+    meta.json alone for versioned stores (its version directory is named after
+    the column data); meta.json plus the column files for the older flat layout.
+    """
+    meta = _read_meta(path)
+    files = [os.path.join(path, 'meta.json')]
+    if 'dir' not in meta:
+        files += [os.path.join(path, entry['file']) for entry in meta['columns']]
+    return files
+
+def load_table(path, columns=None, mmap=True):
+    """Loads a columnar store, memory-mapping the column files by default.
+
+    Numeric columns are zero-copy, read-only views of the mapped files and text
+    columns come back as categoricals over their mapped codes.
+    """
+    meta = _read_meta(path)
+    base = os.path.join(path, meta.get('dir', ''))
+
+    data = {}
+    for entry in meta['columns']:
+        if columns is not None and entry['name'] not in columns:
+            continue
+        values = np.load(os.path.join(base, entry['file']), mmap_mode='r' if mmap else None,
+                         allow_pickle=False)
+        if entry['kind'] == 'category':
+            data[entry['name']] = pd.Categorical.from_codes(
+                values, categories=entry['categories'], ordered=entry['ordered'], validate=False
+            )
+        else:
+            data[entry['name']] = values
+    return pd.DataFrame(data, copy=False)
+
+def read_table(path, **kwargs):
+    """Reads either a columnar store or a CSV file, whichever ``path`` points to."""
+    if is_store(path):
+        return load_table(path, **kwargs)
+    return pd.read_csv(path, **kwargs)
+
+def write_table(df, path, export_csv=None):
+    """Writes to a store or CSV depending on ``path``, optionally exporting a CSV copy too."""
+    if path.endswith(STORE_SUFFIX):
+        save_table(df, path)
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+    if export_csv:
+        df.to_csv(export_csv, index=False, encoding='utf-8-sig')
@@ -1,134 +1,234 @@
 import matplotlib
 matplotlib.use('Agg') # Non-interactive backend
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-import matplotlib.pyplot as plt
 import seaborn as sns
-import os
-from .config import get_economic_df
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+from .enrich import ensure_enriched
+from .profiling import span
+from .store import read_table
+
+# Shared style settings; part of every chart's cache key
+STYLE = {'axes_style': 'whitegrid'}
+FULL_DPI = 300
+PREVIEW_DPI = 72
+# Above this many points the swarm overlay falls back to a jittered strip plot
+SWARM_MAX_POINTS = 1000
+# One small hash file per chart, so concurrent renderers into the same directory never clobber each other
+HASH_DIR = '.chart_hashes'
+
+# --- Chart renderers: each draws one figure from its own data slice ---
+
+def _render_seat_share(fig, data):
+    winner_counts = data['Winner_Alliance'].value_counts()
+    ax = fig.subplots()
+    ax.pie(winner_counts, labels=winner_counts.index, autopct='%1.1f%%', startangle=140,
+           colors=sns.color_palette('pastel'), pctdistance=0.85,
+           explode=[0.05]*len(winner_counts), textprops={'fontsize': 12})
+    ax.add_artist(Circle((0,0),0.70,fc='white'))
+    ax.set_title('2026 Election Seat Share by Alliance', fontsize=16, fontweight='bold')
+
+def _render_division_wins(fig, data):
+    ax = fig.subplots()
+    data.plot(kind='bar', stacked=True, ax=ax, colormap='viridis', width=0.8)
+    ax.set_title('Division-wise Seat Wins by Alliance', fontsize=16, fontweight='bold')
+    ax.set_ylabel('Number of Seats')
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_ha('right')
+    ax.legend(title='Alliance', bbox_to_anchor=(1.02, 1), loc='upper left')
+    # Annotate bars
+    for c in ax.containers:
+        labels = [int(v) if v > 0 else "" for v in c.datavalues]
+        ax.bar_label(c, labels=labels, label_type='center', fontsize=10, color='white', fontweight='bold')
+
+def _render_income_scatter(fig, data, y, title, ylabel):
+    ax = fig.subplots()
+    sns.scatterplot(data=data, x='Monthly_Income', y=y, hue='Division', ax=ax,
+                    style='Division', s=120, palette='deep', alpha=0.9, edgecolor='black')
+    ax.set_title(title, fontsize=16, fontweight='bold')
+    ax.set_xlabel('Avg. Monthly Income of Division (BDT)')
+    ax.set_ylabel(ylabel)
+    ax.legend(bbox_to_anchor=(1.02, 1), loc='upper left', title='Division')
+
+def _render_expenditure_box(fig, data):
+    ax = fig.subplots()
+    sns.boxplot(data=data, x='Winner_Alliance', y='Expenditure', hue='Winner_Alliance', legend=False,
+                palette='Set2', width=0.5, linewidth=2, ax=ax)
+    if len(data) <= SWARM_MAX_POINTS:
+        sns.swarmplot(data=data, x='Winner_Alliance', y='Expenditure', color='black', alpha=0.5, size=4, ax=ax)
+    else:
+        sns.stripplot(data=data, x='Winner_Alliance', y='Expenditure', color='black', alpha=0.2, size=2,
+                      jitter=0.2, ax=ax)
+    ax.set_title('Expenditure Decision Boundary by Winning Alliance', fontsize=16, fontweight='bold')
+
+def _render_weighted_impact(fig, data, alliance):
+    ax = fig.subplots()
+    sns.barplot(data=data, x='Division', y='Percentage', hue='Metric', palette='viridis', ax=ax)
+    ax.set_title(f'{alliance}: Raw Performance vs. Weighted National Impact (2026)')
+    ax.set_ylabel('Percentage / Impact Score')
+    ax.set_xlabel('Division (Sorted by Monthly Income)')
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+
+# --- Task execution and caching ---
+
+def _chart_task(filename, render, data, figsize, dpi=FULL_DPI, **kwargs):
+    return {'file': filename, 'render': render, 'data': data, 'figsize': figsize, 'dpi': dpi, 'kwargs': kwargs}
+
+def _task_hash(task, dpi):
+    """Hashes a chart's data slice, renderer source, layout and style settings."""
+    h = hashlib.sha256()
+    h.update(pd.util.hash_pandas_object(task['data'], index=True).to_numpy().tobytes())
+    h.update(json.dumps([list(map(str, getattr(task['data'], 'columns', []))),
+                         task['figsize'], dpi, task['kwargs'], STYLE], sort_keys=True, default=str).encode())
+    h.update(inspect.getsource(task['render']).encode())
+    return h.hexdigest()
+
+def _render_task(task, path, dpi):
+    """Draws one chart on a standalone Figure (no pyplot global state) and saves it."""
+    with span(f"chart:{task['file']}", rows=len(task['data']), dpi=dpi), sns.axes_style(STYLE['axes_style']):
+        fig = Figure(figsize=task['figsize'])
+        task['render'](fig, task['data'], **task['kwargs'])
+        fig.tight_layout()
+        fig.savefig(path, dpi=dpi)
+    return path
+
+def _hash_path(output_dir, filename):
+    return os.path.join(output_dir, HASH_DIR, f"{filename}.sha256")
+
+def _read_hash(output_dir, filename):
+    try:
+        with open(_hash_path(output_dir, filename), encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _write_hash(output_dir, filename, key):
+    path = _hash_path(output_dir, filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(key)
+    os.replace(tmp_path, path)
+
+def render_charts(tasks, output_dir, workers=None, preview=False):
+    """Renders chart tasks across a process pool, skipping charts whose inputs are unchanged.
+
+    ``preview`` renders at low dpi into ``output_dir/preview`` for fast iteration.
+    Returns the list of paths that were actually re-rendered.
+    """
+    if preview:
+        output_dir = os.path.join(output_dir, 'preview')
+    os.makedirs(output_dir, exist_ok=True)
+
+    stale = []
+    for task in tasks:
+        dpi = PREVIEW_DPI if preview else task['dpi']
+        path = os.path.join(output_dir, task['file'])
+        key = _task_hash(task, dpi)
+        if _read_hash(output_dir, task['file']) == key and os.path.exists(path):
+            continue
+        stale.append((task, path, dpi, key))
+
+    # Each chart's hash is recorded as soon as it is saved
+    if len(stale) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count(), len(stale))) as pool:
+            for (task, _, _, key), _ in zip(stale, pool.map(_render_task, *zip(*[(t, p, d) for t, p, d, _ in stale]))):
+                _write_hash(output_dir, task['file'], key)
+    else:
+        for task, path, dpi, key in stale:
+            _render_task(task, path, dpi)
+            _write_hash(output_dir, task['file'], key)
+    return [path for _, path, _, _ in stale]
+
+def build_chart_tasks(df):
+    """Builds the five seat-level chart tasks from a (preferably enriched) seat table."""
+    df = ensure_enriched(df)
+    tasks = []
 
-def generate_charts(df, output_dir):
-    """Generates and saves five improved election visualization charts."""
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        
-    # Standardize economic data and division names
-    df_econ = get_economic_df()
-    df_merged = pd.merge(df, df_econ, on='Division', how='left')
-    sns.set_style("whitegrid")
-    
     # --- PLOT 1: Improved Seat Share Pie Chart (Donut) ---
     if 'Winner_Alliance' in df.columns:
-        winner_counts = df['Winner_Alliance'].value_counts()
-        plt.figure(figsize=(10, 8))
-        plt.pie(winner_counts, labels=winner_counts.index, autopct='%1.1f%%', startangle=140, 
-                colors=sns.color_palette('pastel'), pctdistance=0.85, 
-                explode=[0.05]*len(winner_counts), textprops={'fontsize': 12})
-        plt.gcf().gca().add_artist(plt.Circle((0,0),0.70,fc='white'))
-        plt.title('2026 Election Seat Share by Alliance', fontsize=16, fontweight='bold')
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'Seat_Share_Pie_Chart_Improved.png'), dpi=300)
-        plt.close()
+        tasks.append(_chart_task('Seat_Share_Pie_Chart_Improved.png', _render_seat_share,
+                                 df[['Winner_Alliance']], (10, 8)))
 
     # --- PLOT 2: Improved Division-wise Stacked Bar Chart ---
     if 'Winner_Alliance' in df.columns:
-        div_counts = df.groupby(['Division', 'Winner_Alliance']).size().unstack(fill_value=0)
-        ax = div_counts.plot(kind='bar', stacked=True, figsize=(12, 8), colormap='viridis', width=0.8)
-        plt.title('Division-wise Seat Wins by Alliance', fontsize=16, fontweight='bold')
-        plt.ylabel('Number of Seats')
-        plt.xticks(rotation=45, ha='right')
-        plt.legend(title='Alliance', bbox_to_anchor=(1.02, 1), loc='upper left')
-        # Annotate bars
-        for c in ax.containers:
-            labels = [int(v) if v > 0 else "" for v in c.datavalues]
-            ax.bar_label(c, labels=labels, label_type='center', fontsize=10, color='white', fontweight='bold')
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'Division_Seat_Wins_Bar_Chart_Improved.png'), dpi=300)
-        plt.close()
-
-    # Define alliances for vote share calculation
-    alliance_cols = ['BNP-A', '11PA', 'DUF', 'GSA', 'IAB', 'IND', 'NDF', 'Others']
-    existing_cols = [c for c in alliance_cols if c in df.columns]
-    df_merged['Total_Votes_Seat'] = df_merged[existing_cols].sum(axis=1)
+        div_counts = df.groupby(['Division', 'Winner_Alliance'], observed=True).size().unstack(fill_value=0)
+        tasks.append(_chart_task('Division_Seat_Wins_Bar_Chart_Improved.png', _render_division_wins,
+                                 div_counts, (12, 8)))
 
     # --- PLOT 3: Improved Scatter Plot (Income vs BNP-A Vote Share) ---
-    if 'BNP-A' in df.columns:
-        df_merged['BNP_Vote_Share'] = (df_merged['BNP-A'] / df_merged['Total_Votes_Seat']) * 100
-        plt.figure(figsize=(12, 8))
-        sns.scatterplot(data=df_merged, x='Monthly_Income', y='BNP_Vote_Share', hue='Division', 
-                        style='Division', s=120, palette='deep', alpha=0.9, edgecolor='black')
-        plt.title('Monthly Income vs BNP-A Vote Share', fontsize=16, fontweight='bold')
-        plt.xlabel('Avg. Monthly Income of Division (BDT)')
-        plt.ylabel('BNP-A Vote Share in Seat (%)')
-        plt.legend(bbox_to_anchor=(1.02, 1), loc='upper left', title='Division')
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'Income_vs_BNP_Vote_Share_Scatter_Improved.png'), dpi=300)
-        plt.close()
+    if 'BNP-A_Share' in df.columns:
+        bnp_share = df[['Division', 'Monthly_Income', 'BNP-A_Share']].rename(columns={'BNP-A_Share': 'BNP_Vote_Share'})
+        tasks.append(_chart_task('Income_vs_BNP_Vote_Share_Scatter_Improved.png', _render_income_scatter,
+                                 bnp_share, (12, 8),
+                                 y='BNP_Vote_Share', title='Monthly Income vs BNP-A Vote Share',
+                                 ylabel='BNP-A Vote Share in Seat (%)'))
 
     # --- PLOT 4: Improved Scatter Plot (Income vs Jamaat Vote Share) ---
-    if '11PA' in df.columns:
-        df_merged['Jamaat_Vote_Share'] = (df_merged['11PA'] / df_merged['Total_Votes_Seat']) * 100
-        plt.figure(figsize=(12, 8))
-        sns.scatterplot(data=df_merged, x='Monthly_Income', y='Jamaat_Vote_Share', hue='Division', 
-                        style='Division', s=120, palette='deep', alpha=0.9, edgecolor='black')
-        plt.title('Monthly Income vs Jamaat Alliance (11PA) Vote Share', fontsize=16, fontweight='bold')
-        plt.xlabel('Avg. Monthly Income of Division (BDT)')
-        plt.ylabel('Jamaat Alliance Vote Share in Seat (%)')
-        plt.legend(bbox_to_anchor=(1.02, 1), loc='upper left', title='Division')
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'Income_vs_Jamaat_Vote_Share_Scatter_Improved.png'), dpi=300)
-        plt.close()
+    if '11PA_Share' in df.columns:
+        jamaat_share = df[['Division', 'Monthly_Income', '11PA_Share']].rename(columns={'11PA_Share': 'Jamaat_Vote_Share'})
+        tasks.append(_chart_task('Income_vs_Jamaat_Vote_Share_Scatter_Improved.png', _render_income_scatter,
+                                 jamaat_share, (12, 8),
+                                 y='Jamaat_Vote_Share', title='Monthly Income vs Jamaat Alliance (11PA) Vote Share',
+                                 ylabel='Jamaat Alliance Vote Share in Seat (%)'))
 
     # --- PLOT 5: Improved Box Plot (Expenditure Decision) ---
     if 'Winner_Alliance' in df.columns and 'BNP-A' in df.columns and '11PA' in df.columns:
-        main_alliances = df_merged[df_merged['Winner_Alliance'].isin(['BNP-A', '11PA'])]
+        main_alliances = df[df['Winner_Alliance'].isin(['BNP-A', '11PA'])]
         if not main_alliances.empty:
-            plt.figure(figsize=(10, 6))
-            sns.boxplot(data=main_alliances, x='Winner_Alliance', y='Expenditure', palette='Set2', width=0.5, linewidth=2)
-            sns.swarmplot(data=main_alliances, x='Winner_Alliance', y='Expenditure', color='black', alpha=0.5, size=4)
-            plt.title('Expenditure Decision Boundary by Winning Alliance', fontsize=16, fontweight='bold')
-            plt.tight_layout()
-            plt.savefig(os.path.join(output_dir, 'Expenditure_vs_Winner_Boxplot_Improved.png'), dpi=300)
-            plt.close()
-
-    print(f"✅ All 5 improved visualizations saved to {output_dir}")
-    
-def generate_weighted_impact_chart(analysis_file, output_dir='images'):
-    """Creates a comparison between Raw Vote Share and Weighted National Impact."""
-    if not os.path.exists(analysis_file):
-        return
+            tasks.append(_chart_task('Expenditure_vs_Winner_Boxplot_Improved.png', _render_expenditure_box,
+                                     main_alliances[['Winner_Alliance', 'Expenditure']], (10, 6)))
+    return tasks
 
-    df = pd.read_csv(analysis_file)
-    os.makedirs(output_dir, exist_ok=True)
+def generate_charts(df, output_dir, workers=None, preview=False):
+    """Generates and saves five improved election visualization charts."""
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
 
+    tasks = build_chart_tasks(df)
+    rendered = render_charts(tasks, output_dir, workers=workers, preview=preview)
+    print(f"✅ {len(tasks)} improved visualizations up to date in {output_dir} ({len(rendered)} re-rendered)")
+
+def build_weighted_impact_tasks(df):
+    """Builds the raw-share vs. weighted-impact chart tasks from a division table."""
     # We will visualize the two main alliances
     alliances = ['BNP-A', '11PA']
-    
+    tasks = []
+
     for alliance in alliances:
         if alliance not in df.columns or f'Weighted_{alliance}' not in df.columns:
             continue
 
-        plt.figure(figsize=(12, 6))
-        
         # Prepare data for plotting
         plot_df = df[['Division', alliance, f'Weighted_{alliance}']].copy()
         plot_df = plot_df.melt(id_vars='Division', var_name='Metric', value_name='Percentage')
-        
+
         # Rename metrics for better legends
         plot_df['Metric'] = plot_df['Metric'].replace({
             alliance: 'Raw Vote Share (%)',
             f'Weighted_{alliance}': 'Weighted National Impact (%)'
         })
 
-        sns.barplot(data=plot_df, x='Division', y='Percentage', hue='Metric', palette='viridis')
-        
-        plt.title(f'{alliance}: Raw Performance vs. Weighted National Impact (2026)')
-        plt.ylabel('Percentage / Impact Score')
-        plt.xlabel('Division (Sorted by Monthly Income)')
-        plt.xticks(rotation=45)
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.tight_layout()
-        
-        save_path = os.path.join(output_dir, f'weighted_impact_{alliance.lower()}.png')
-        plt.savefig(save_path)
-        plt.close()
-        print(f"✅ Weighted impact chart saved: {save_path}")
\ No newline at end of file
+        tasks.append(_chart_task(f'weighted_impact_{alliance.lower()}.png', _render_weighted_impact,
+                                 plot_df, (12, 6), dpi=100, alliance=alliance))
+    return tasks
+
+def generate_weighted_impact_chart(analysis_file, output_dir='images', workers=None, preview=False):
+    """Creates a comparison between Raw Vote Share and Weighted National Impact."""
+    if not os.path.exists(analysis_file):
+        return
+
+    df = read_table(analysis_file)
+    os.makedirs(output_dir, exist_ok=True)
+
+    tasks = build_weighted_impact_tasks(df)
+    for path in render_charts(tasks, output_dir, workers=workers, preview=preview):
+        print(f"✅ Weighted impact chart saved: {path}")
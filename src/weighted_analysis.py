@@ -1,33 +1,47 @@
-import pandas as pd
 import os
-from .config import get_economic_df
-
-def run_weighted_analysis(input_path, output_path):
-    """Calculates the weighted voter impact per division."""
-    if not os.path.exists(input_path):
-        return
+import pandas as pd
+from .config import ALLIANCE_COLUMNS, get_economic_df
+from .enrich import ECONOMIC_COLUMNS, ensure_enriched
+from .rollup import RollupCube
+from .store import read_table, write_table
 
-    df_votes = pd.read_csv(input_path)
-    df_econ = get_economic_df()
+# Alliances that get a Weighted_<alliance> national-impact column
+WEIGHTED_ALLIANCES = ALLIANCE_COLUMNS
 
-    # Define alliances for analysis
-    alliance_cols = ['BNP-A', '11PA', 'DUF', 'GSA', 'IAB', 'IND', 'NDF', 'Others']
-    available_cols = [c for c in alliance_cols if c in df_votes.columns]
+def division_table(divisions, alliances, total_votes, share, voter_weight, weighted):
+    """Assembles the division analysis table from per-division metrics (see ``rollup.derive_metrics``).
 
-    # Aggregate and calculate weights
-    div_performance = df_votes.groupby('Division')[available_cols].sum()
-    div_total_votes = div_performance.sum(axis=1)
-    div_perf_pct = div_performance.div(div_total_votes, axis=0) * 100
-    merged = pd.merge(div_perf_pct.reset_index(), df_econ, on='Division')
+    Alliance shares, the division's economic indicators, vote total, voter
+    weight and a Weighted_ column per alliance; divisions without votes are
+    left out and rows are sorted by income. Used by run_weighted_analysis and
+    by live snapshots, so both publish the same table.
+    """
+    index = pd.Index(divisions, name='Division')
+    merged = pd.DataFrame(share, index=index, columns=alliances)
+    merged = merged.join(get_economic_df().set_index('Division')[ECONOMIC_COLUMNS], how='inner')
+    merged['Division_Total_Votes'] = pd.Series(total_votes, index=index)
+    merged['Voter_Weight'] = pd.Series(voter_weight, index=index)
+    weighted = pd.DataFrame(weighted, index=index, columns=alliances)
+    for alliance in WEIGHTED_ALLIANCES:
+        if alliance in weighted.columns:
+            merged[f'Weighted_{alliance}'] = weighted[alliance]
+    merged = merged[merged['Division_Total_Votes'] > 0].reset_index()
+    return merged.sort_values(by='Monthly_Income', ascending=False)
 
-    total_national_votes = div_total_votes.sum()
-    merged['Division_Total_Votes'] = merged['Division'].map(div_total_votes.to_dict())
-    merged['Voter_Weight'] = merged['Division_Total_Votes'] / total_national_votes
+def run_weighted_analysis(input_path, output_path, export_csv=None):
+    """Calculates the weighted voter impact per division (every alliance gets a Weighted_ column).
 
-    for alliance in ['BNP-A', '11PA']:
-        if alliance in merged.columns:
-            merged[f'Weighted_{alliance}'] = merged[alliance] * merged['Voter_Weight']
+    ``input_path``/``output_path`` may be CSV files or columnar stores; with
+    ``export_csv`` a CSV copy of the result is written as well.
+    """
+    if not os.path.exists(input_path):
+        return
 
-    merged = merged.sort_values(by='Monthly_Income', ascending=False)
-    merged.to_csv(output_path, index=False, encoding='utf-8-sig')
-    print(f"✅ Weighted analysis saved to: {output_path}")
\ No newline at end of file
+    df_votes = ensure_enriched(read_table(input_path))
+    cube = RollupCube(df_votes)
+    merged = division_table(cube.keys('division'), cube.alliances,
+                            *(cube.frame('division', m).to_numpy()
+                              for m in ('Total_Votes', 'Share', 'Voter_Weight', 'Weighted')))
+    write_table(merged, output_path, export_csv=export_csv)
+    print(f"✅ Weighted analysis saved to: {output_path}")
+    return merged
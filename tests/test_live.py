@@ -0,0 +1,47 @@
+import os
+import pandas as pd
+import pytest
+from src.config import ALLIANCE_COLUMNS
+from src.live import LiveResults
+from src.process_data import clean_and_process
+
+RAW_CSV = os.path.join(os.path.dirname(__file__), os.pardir, "data", "raw_election_data.csv")
+
+@pytest.fixture(scope="module")
+def raw():
+    return pd.read_csv(RAW_CSV, encoding="utf-8-sig")
+
+def test_snapshot_matches_clean_and_process(raw):
+    live = LiveResults(raw)
+    seats = clean_and_process(RAW_CSV).set_index("Seat_ID")
+    frame = live.snapshot.seats_frame().set_index("Seat_ID")
+    alliances = [a for a in ALLIANCE_COLUMNS if a in seats.columns]
+    pd.testing.assert_frame_equal(frame.loc[seats.index, alliances], seats[alliances], check_dtype=False)
+
+def test_update_rejects_ambiguous_names_and_accepts_positions(raw):
+    live = LiveResults(raw)
+    seat = raw[raw["Seat_ID"] == 92].reset_index(drop=True)
+    name = seat["Candidate"][seat["Candidate"].duplicated()].iloc[0]
+    with pytest.raises(ValueError, match="ambiguous"):
+        live.update({92: {name: 10}})
+
+    positions = seat.index[seat["Candidate"] == name].tolist()
+    before = sum(live.snapshot.seat(92)["Votes"].values())
+    live.update({92: {positions[0]: 10, positions[1]: 5}})
+    assert sum(live.snapshot.seat(92)["Votes"].values()) == before + 15
+
+def test_wait_rendered_covers_the_latest_update(raw, tmp_path):
+    live = LiveResults(raw, output_dir=str(tmp_path), preview=True)
+    first = raw["Candidate"][raw["Seat_ID"] == 1].iloc[0]
+    for votes in (1, 2, 3):
+        live.update({1: {first: votes}})
+    assert live.wait_rendered(timeout=120)
+    assert live.rendered_version == live.snapshot.version
+
+def test_division_frame_matches_run_weighted_analysis(raw, tmp_path):
+    from src.weighted_analysis import run_weighted_analysis
+    clean_and_process(RAW_CSV).to_csv(tmp_path / "seats.csv", index=False)
+    expected = run_weighted_analysis(str(tmp_path / "seats.csv"), str(tmp_path / "division.csv"))
+    live = LiveResults(raw)
+    pd.testing.assert_frame_equal(live.snapshot.division_frame().reset_index(drop=True),
+                                  expected.reset_index(drop=True), check_dtype=False)
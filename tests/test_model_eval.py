@@ -0,0 +1,33 @@
+import os
+import pytest
+from src.enrich import enrich_seats
+from src.model_eval import build_features, evaluate_models
+from src.process_data import clean_and_process
+
+RAW_CSV = os.path.join(os.path.dirname(__file__), os.pardir, "data", "raw_election_data.csv")
+
+@pytest.fixture(scope="module")
+def seats():
+    return enrich_seats(clean_and_process(RAW_CSV))
+
+def _evaluate(seats, cache_dir, workers, min_samples_leaf=5):
+    return evaluate_models(seats, models=['tree'],
+                           param_grids={'tree': {'max_depth': [2], 'min_samples_leaf': [min_samples_leaf]}},
+                           n_splits=3, cv_repeats=1, importance_repeats=2, n_bootstrap=60,
+                           workers=workers, cache_dir=str(cache_dir))
+
+def test_features_follow_the_requested_list(seats):
+    _, _, names = build_features(seats, features=['Turnout', 'Monthly_Income', 'Not_A_Column'])
+    assert names == ['Turnout', 'Monthly_Income']
+
+def test_bootstrap_cache_is_shared_across_worker_counts(seats, tmp_path):
+    first = _evaluate(seats, tmp_path, workers=1)
+    second = _evaluate(seats, tmp_path, workers=2)
+    assert first['computed_tasks'] > 0
+    assert second['computed_tasks'] == 0
+    assert second['stability'] == first['stability']
+
+def test_all_stump_bootstrap_has_no_root_threshold(seats, tmp_path):
+    result = _evaluate(seats, tmp_path, workers=1, min_samples_leaf=10_000)
+    assert result['stability']['root_threshold'] is None
+    assert result['stability']['root_feature_frequency'] == {}
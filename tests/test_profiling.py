@@ -0,0 +1,38 @@
+import json
+import os
+import numpy as np
+import pytest
+from src import profiling
+from src.profiling import load_trace, span, start_trace_run, write_chrome_trace
+
+@pytest.fixture
+def tracing(tmp_path, monkeypatch):
+    monkeypatch.setenv(profiling.TRACE_ENV, str(tmp_path))
+    monkeypatch.setenv(profiling.TRACE_RUN_ENV, "")
+    start_trace_run()
+    return tmp_path
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/clear_refs"), reason="needs a resettable VmHWM (Linux)")
+def test_peak_rss_is_per_span(tracing):
+    with span("outer"):
+        with span("heavy"):
+            block = np.ones(300 * 2**20 // 8)  # ~300 MB, touched
+            del block
+        with span("light"):
+            np.ones(1000).sum()
+    records = {r["name"]: r for r in load_trace(str(tracing))}
+    assert records["heavy"]["rss_growth_mb"] > 200
+    assert records["light"]["peak_rss_mb"] < records["heavy"]["peak_rss_mb"] - 200
+    # The enclosing span still sees the inner peak
+    assert records["outer"]["peak_rss_mb"] >= records["heavy"]["peak_rss_mb"]
+
+def test_chrome_trace_only_holds_the_current_run(tracing):
+    with span("stage:weighted"):
+        pass
+    start_trace_run()
+    with span("stage:weighted"):
+        pass
+    with open(write_chrome_trace(str(tracing))) as f:
+        events = json.load(f)["traceEvents"]
+    assert [e["name"] for e in events] == ["stage:weighted"]
+    assert len(load_trace(str(tracing))) == 2
@@ -0,0 +1,35 @@
+import json
+import os
+import urllib.request
+import pytest
+from src.query_service import QueryService, serve_in_background
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "data")
+
+@pytest.fixture(scope="module")
+def service():
+    return QueryService(os.path.join(DATA_DIR, "seat_wise_votes.csv"),
+                        os.path.join(DATA_DIR, "division_analysis.csv"), check_interval=3600)
+
+def test_answers_are_read_only(service):
+    seat = service.seat(12)
+    with pytest.raises(TypeError):
+        seat["Margin"] = -1
+    with pytest.raises(TypeError):
+        seat["Votes"]["BNP-A"] = 0
+    margins = service.top_margins(5)
+    assert isinstance(margins, tuple)
+    with pytest.raises(TypeError):
+        margins[0]["Margin"] = -1
+    assert service.seat(12) == seat
+
+def test_http_answers_match_in_process_queries(service):
+    server, base_url = serve_in_background(service, port=0)
+    try:
+        with urllib.request.urlopen(f"{base_url}/margins?n=3&alliance=BNP-A") as response:
+            body = json.load(response)
+    finally:
+        server.shutdown()
+    expected = service.top_margins(3, alliance="BNP-A")
+    assert [seat["Seat_ID"] for seat in body] == [seat["Seat_ID"] for seat in expected]
+    assert all(seat["Winner_Alliance"] == "BNP-A" for seat in body)
@@ -0,0 +1,25 @@
+import os
+import numpy as np
+import pandas as pd
+from src.enrich import enrich_seats
+from src.process_data import clean_and_process
+from src.scenarios import CoalitionModel
+
+RAW_CSV = os.path.join(os.path.dirname(__file__), os.pardir, "data", "raw_election_data.csv")
+
+def test_baseline_scenario_matches_enrich_seats():
+    raw = pd.read_csv(RAW_CSV, encoding="utf-8-sig")
+    model = CoalitionModel(raw)
+    result = model.evaluate([{}])
+    baseline = model.scenario_frame(result, 0)
+
+    enriched = enrich_seats(clean_and_process(RAW_CSV)).set_index("Seat_ID")
+    expected = enriched.loc[baseline["Seat_ID"], "Winner_Alliance"].to_numpy()
+    assert list(baseline["Winner_Alliance"]) == list(expected)
+
+    # Zero-vote seats are undecided and counted for nobody
+    counts = result["seat_counts"].iloc[0]
+    assert counts.sum() == enriched["Winner_Alliance"].notna().sum() < len(enriched)
+    for alliance, seats in enriched["Winner_Alliance"].value_counts().items():
+        assert counts[alliance] == seats
+    assert (result["winners"][0][np.asarray(enriched.loc[baseline["Seat_ID"], "Total_Votes"]) == 0] == -1).all()
@@ -0,0 +1,132 @@
+import json
+import os
+import pandas as pd
+import pytest
+from src.scraper import cache_dir_for, merge_cache_into_csv, save_seat_cache
+
+RAW_CSV = os.path.join(os.path.dirname(__file__), os.pardir, "data", "raw_election_data.csv")
+
+def _seat_rows(df, seat_id):
+    rows = df[df["Seat_ID"] == seat_id].drop(columns=["Status", "Division"])
+    return rows.to_dict("records")
+
+def test_partial_merge_keeps_seats_outside_the_cache(tmp_path):
+    raw = pd.read_csv(RAW_CSV, encoding="utf-8-sig")
+    output_file = tmp_path / "raw_election_data.csv"
+    raw.to_csv(output_file, index=False, encoding="utf-8-sig")
+    cache_dir = tmp_path / "cache"
+
+    # Seat 2 is refreshed with a changed vote count; seat 3 failed
+    refreshed = _seat_rows(raw, 2)
+    refreshed[0]["Votes"] = "১"
+    save_seat_cache(cache_dir, 2, refreshed)
+    save_seat_cache(cache_dir, 3, error="timeout")
+
+    merged = merge_cache_into_csv(cache_dir, output_file)
+    on_disk = pd.read_csv(output_file, encoding="utf-8-sig")
+
+    assert len(on_disk) == len(raw) == len(merged)
+    assert on_disk["Seat_ID"].is_monotonic_increasing
+    assert set(on_disk["Seat_ID"]) == set(raw["Seat_ID"])
+    untouched = on_disk[on_disk["Seat_ID"] != 2].reset_index(drop=True)
+    pd.testing.assert_frame_equal(untouched, raw[raw["Seat_ID"] != 2].reset_index(drop=True))
+    seat_2 = on_disk[on_disk["Seat_ID"] == 2]
+    assert seat_2["Votes"].tolist()[0] == "১"
+    # Refreshed seats use the same Status labels as the untouched rows
+    assert set(seat_2["Status"]) <= set(untouched["Status"])
+    # The old winner dropped to one vote, so the runner-up is marked as winner
+    winner, loser = raw.loc[raw["Seat_ID"] == 2, "Status"].iloc[:2]
+    assert seat_2["Status"].tolist() == [loser, winner] + [loser] * (len(seat_2) - 2)
+    assert (seat_2["Division"] == raw.loc[raw["Seat_ID"] == 2, "Division"].iloc[0]).all()
+
+def test_cache_dir_follows_output_file():
+    assert cache_dir_for(os.path.join("data", "raw_election_data.csv")) == os.path.join("data", "cache", "seats")
+    assert cache_dir_for(os.path.join("data", "raw_election_data_local.csv")) != os.path.join("data", "cache", "seats")
+    assert cache_dir_for(os.path.join("other", "raw_election_data.csv")) == os.path.join("other", "cache", "seats")
+
+def test_worker_pool_retries_and_records_failures(tmp_path, monkeypatch):
+    import src.scraper as scraper
+    from src.fixture_server import serve_in_background
+
+    calls = []
+    fetch_seat = scraper.scrape_seat_http
+    def counting_fetch(session, seat_id, *args, **kwargs):
+        calls.append(seat_id)
+        return fetch_seat(session, seat_id, *args, **kwargs)
+    monkeypatch.setattr(scraper, "scrape_seat_http", counting_fetch)
+
+    server, base_url = serve_in_background(RAW_CSV, port=0, failure_rate=0.3)
+    output_file = tmp_path / "raw_election_data.csv"
+    cache_dir = tmp_path / "cache"
+    seat_ids = list(range(1, 41)) + [999]  # 999 is not served: 404 on every attempt
+    try:
+        scraper.run_scraper(workers=4, rate_limit=None, max_retries=8, backoff=0.001, base_url=base_url,
+                            seat_ids=seat_ids, output_file=str(output_file), cache_dir=str(cache_dir),
+                            engine="http")
+    finally:
+        server.shutdown()
+
+    raw = pd.read_csv(RAW_CSV, encoding="utf-8-sig")
+    scraped = pd.read_csv(output_file, encoding="utf-8-sig")
+    expected = raw[raw["Seat_ID"] <= 40].drop(columns=["Division"]).reset_index(drop=True)
+    # Seats finish in any order across workers but land in the CSV in seat order
+    assert scraped["Seat_ID"].is_monotonic_increasing
+    pd.testing.assert_frame_equal(scraped, expected)
+
+    # 503s were retried, and the seat that never loads is recorded as failed
+    assert len(calls) > len(seat_ids)
+    assert calls.count(999) == 9
+    assert scraper.load_seat_cache(cache_dir, 999)["status"] == "failed"
+    assert scraper.seats_to_fetch(seat_ids, cache_dir) == [999]
+
+# Saved seat pages. Expected rows come from seat_<id>.json when a capture recorded the
+# Selenium parser's output (see capture_seat_page), else from the committed raw CSV,
+# which the Selenium parser produced from the live site.
+PAGES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "seat_pages")
+PAGE_FILES = sorted(f for f in os.listdir(PAGES_DIR) if f.endswith(".html"))
+
+def _expected_rows(seat_id):
+    captured = os.path.join(PAGES_DIR, f"seat_{seat_id}.json")
+    if os.path.exists(captured):
+        with open(captured, encoding="utf-8") as f:
+            return json.load(f)
+    raw = pd.read_csv(RAW_CSV, encoding="utf-8-sig", dtype=str)
+    rows = raw[raw["Seat_ID"] == str(seat_id)].drop(columns=["Status", "Division"])
+    return [{**row, "Seat_ID": seat_id} for row in rows.to_dict("records")]
+
+@pytest.mark.parametrize("page", PAGE_FILES)
+def test_parse_seat_html_matches_selenium_rows(page):
+    from src.scraper import parse_seat_html
+    seat_id = int(page[len("seat_"):-len(".html")])
+    with open(os.path.join(PAGES_DIR, page), "rb") as f:
+        rows = parse_seat_html(f.read(), seat_id)
+    assert rows == _expected_rows(seat_id)
+
+def test_auto_engine_switches_to_chrome_for_the_rest_of_the_run(tmp_path, monkeypatch):
+    import sys
+    import types
+    import src.scraper as scraper
+
+    raw = pd.read_csv(RAW_CSV, encoding="utf-8-sig", dtype=str)
+    http_calls, browser_calls = [], []
+    def client_rendered(session, seat_id, *args, **kwargs):
+        http_calls.append(seat_id)
+        raise scraper.EmptySeatPage(f"No candidate cards in the HTML for seat {seat_id}")
+    def browser(driver, seat_id, base_url):
+        browser_calls.append(seat_id)
+        rows = raw[raw["Seat_ID"] == str(seat_id)].drop(columns=["Status", "Division"])
+        return [{**row, "Seat_ID": seat_id} for row in rows.to_dict("records")]
+
+    chrome = types.ModuleType("webdriver_manager.chrome")
+    chrome.ChromeDriverManager = lambda: types.SimpleNamespace(install=lambda: "chromedriver")
+    monkeypatch.setitem(sys.modules, "webdriver_manager", types.ModuleType("webdriver_manager"))
+    monkeypatch.setitem(sys.modules, "webdriver_manager.chrome", chrome)
+    monkeypatch.setattr(scraper, "_ensure_selenium", lambda: None)
+    monkeypatch.setattr(scraper, "_new_driver", lambda path, headless: types.SimpleNamespace(quit=lambda: None))
+    monkeypatch.setattr(scraper, "scrape_seat_http", client_rendered)
+    monkeypatch.setattr(scraper, "scrape_seat", browser)
+
+    scraper.run_scraper(workers=1, rate_limit=None, seat_ids=range(1, 6), engine="auto",
+                        output_file=str(tmp_path / "raw_election_data.csv"), cache_dir=str(tmp_path / "cache"))
+    assert http_calls == [1]
+    assert sorted(browser_calls) == [1, 2, 3, 4, 5]
@@ -0,0 +1,29 @@
+import os
+import numpy as np
+import pytest
+from src.enrich import enrich_seats
+from src.process_data import clean_and_process
+from src.simulate import build_share_matrix, simulate_seats
+
+RAW_CSV = os.path.join(os.path.dirname(__file__), os.pardir, "data", "raw_election_data.csv")
+
+@pytest.fixture(scope="module")
+def seats():
+    return enrich_seats(clean_and_process(RAW_CSV))
+
+def test_noiseless_simulation_matches_enrich_seats_winners(seats):
+    result = simulate_seats(seats, draws=2_000, national_sd=1e-9, division_sd=1e-9, seat_sd=1e-9,
+                            chunk_size=500, seed=7, workers=1)
+    winners = seats["Winner_Alliance"].value_counts()
+    expected = result["expected_seats"]
+    for alliance in expected.index:
+        assert expected[alliance] == pytest.approx(winners.get(alliance, 0))
+    # Zero-vote seats are reported as undecided instead of going to a random contender
+    assert sorted(result["undecided_seats"]) == sorted(seats.loc[seats["Total_Votes"] == 0, "Seat_ID"])
+    assert not result["tipping_points"]["Seat_ID"].isin(result["undecided_seats"]).any()
+
+def test_seats_without_division_are_rejected(seats):
+    broken = seats.copy()
+    broken.loc[0, "Division"] = np.nan
+    with pytest.raises(ValueError, match="Division"):
+        build_share_matrix(broken)
@@ -0,0 +1,50 @@
+import os
+import threading
+import numpy as np
+import pandas as pd
+from src.store import content_files, load_table, save_table
+
+def _frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Seat_ID": np.arange(1, n + 1),
+        "Division": rng.choice(["Dhaka", "Khulna", "Sylhet"], n),
+        "Votes": rng.integers(0, 200_000, n),
+        "Share": rng.random(n),
+    })
+
+def test_roundtrip_and_unchanged_rewrite_is_stable(tmp_path):
+    path = str(tmp_path / "seats.cols")
+    df = _frame(50)
+    save_table(df, path)
+    loaded = load_table(path, mmap=False)
+    pd.testing.assert_frame_equal(loaded.assign(Division=loaded["Division"].astype(str)), df,
+                                  check_dtype=False)
+
+    with open(content_files(path)[0], "rb") as f:
+        before = f.read()
+    save_table(df, path)
+    with open(content_files(path)[0], "rb") as f:
+        assert f.read() == before
+
+def test_readers_never_see_a_missing_table(tmp_path):
+    path = str(tmp_path / "seats.cols")
+    save_table(_frame(2000, seed=0), path)
+    errors, stop = [], threading.Event()
+
+    def read():
+        while not stop.is_set():
+            try:
+                assert len(load_table(path, mmap=False)) == 2000
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for seed in range(1, 40):
+        save_table(_frame(2000, seed=seed), path)
+    stop.set()
+    reader.join()
+    assert errors == []
+    # Only the live and the previous version are kept
+    assert len([n for n in os.listdir(path) if n.startswith("v-")]) == 2
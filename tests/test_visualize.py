@@ -0,0 +1,27 @@
+import os
+import threading
+import pandas as pd
+from src.enrich import enrich_seats
+from src.process_data import clean_and_process
+from src.visualize import build_chart_tasks, build_weighted_impact_tasks, render_charts
+from src.weighted_analysis import run_weighted_analysis
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "data")
+
+def test_concurrent_renders_keep_each_others_hashes(tmp_path):
+    seats = enrich_seats(clean_and_process(os.path.join(DATA_DIR, "raw_election_data.csv")))
+    seats.to_csv(tmp_path / "seats.csv", index=False)
+    run_weighted_analysis(str(tmp_path / "seats.csv"), str(tmp_path / "division.csv"))
+    divisions = pd.read_csv(tmp_path / "division.csv")
+    task_sets = [build_chart_tasks(seats), build_weighted_impact_tasks(divisions)]
+
+    threads = [threading.Thread(target=render_charts, args=(tasks, str(tmp_path)),
+                                kwargs={"workers": 1, "preview": True}) for tasks in task_sets]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Both stages' hashes survived, so nothing is re-rendered
+    for tasks in task_sets:
+        assert render_charts(tasks, str(tmp_path), workers=1, preview=True) == []